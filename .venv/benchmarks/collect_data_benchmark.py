@@ -0,0 +1,93 @@
+"""Load time and peak RSS of DataCollector.collect_data against the previous three-parse path.
+
+Each path runs in a fresh process so peak RSS is measured independently. Run from the project root:
+    python -m benchmarks.collect_data_benchmark --rows 100000
+"""
+import argparse
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import time
+
+from benchmarks.common import build_config, build_workbook, NullLogger, peak_rss_mb, SHEET_NAME
+
+
+def legacy_collect(file_path, header_row):
+    """The pre-streaming collect_data: openpyxl load, sheet XML parse, pd.read_excel, per-filter narrowing."""
+    from zipfile import ZipFile
+    import openpyxl
+    import pandas as pd
+    from lxml import etree
+    from openpyxl.utils import get_column_letter, column_index_from_string
+
+    namespaces = {'a': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+    workbook = openpyxl.load_workbook(filename=file_path, data_only=True)
+    filters = []
+    with ZipFile(file_path) as z:
+        sheet_xml = z.read(f'xl/worksheets/sheet{workbook.sheetnames.index(SHEET_NAME) + 1}.xml')
+    auto_filter = etree.fromstring(sheet_xml).find('.//a:autoFilter', namespaces)
+    for filter_col in auto_filter.findall('.//a:filterColumn', namespaces):
+        col_letter = get_column_letter(int(filter_col.get('colId')) + 1)
+        if filter_col.find('.//a:filters', namespaces) is not None:
+            filters.append((col_letter, [f.get('val') for f in filter_col.findall('.//a:filter', namespaces)]))
+        if filter_col.find('.//a:customFilters', namespaces) is not None:
+            filters.append((col_letter, [(cf.get('operator'), cf.get('val'))
+                                         for cf in filter_col.findall('.//a:customFilter', namespaces)]))
+
+    df = pd.read_excel(file_path, sheet_name=SHEET_NAME, header=header_row - 1)
+    for col_letter, filter_values in filters:
+        col_name = df.columns[column_index_from_string(col_letter) - 1]
+        if all(isinstance(fv, str) for fv in filter_values):
+            df = df[df[col_name].isin(filter_values)]
+        else:
+            for operator, value in filter_values:
+                if operator == 'notEqual':
+                    df = df[~df[col_name].str.contains(re.escape(value.replace("*-*", "-")), na=False)]
+    return df
+
+
+def streaming_collect(file_path, header_row):
+    from data_collection.data_collector import DataCollector
+    return DataCollector(NullLogger(), build_config(file_path, HEADER_ROW=header_row)).collect_data()
+
+
+def measure(name, file_path, results):
+    start = time.perf_counter()
+    df = (legacy_collect if name == 'legacy' else streaming_collect)(file_path, 1)
+    elapsed = time.perf_counter() - start
+    results.put((name, elapsed, peak_rss_mb(), len(df), list(df.iloc[:, 0])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="collect_data load time and peak RSS benchmark")
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='collect_bench_')
+    try:
+        file_path = os.path.join(work_dir, 'tracker.xlsx')
+        build_workbook(file_path, args.rows, auto_filter=True)
+        context = multiprocessing.get_context('spawn')
+        results = context.Queue()
+        measured = {}
+        for name in ('legacy', 'streaming'):
+            process = context.Process(target=measure, args=(name, file_path, results))
+            process.start()
+            result = results.get()
+            process.join()
+            measured[name] = result
+
+        print(f"rows={args.rows} file={os.path.getsize(file_path) / 1e6:.1f}MB")
+        for name, elapsed, peak_mb, count, _ in measured.values():
+            peak = 'n/a' if peak_mb is None else f"{peak_mb:.1f}MB"
+            print(f"{name:>10}: {elapsed:7.2f}s  peak RSS {peak:>9}  filtered rows={count}")
+        print(f"speedup: {measured['legacy'][1] / measured['streaming'][1]:.1f}x  "
+              f"same rows: {measured['legacy'][4] == measured['streaming'][4]}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
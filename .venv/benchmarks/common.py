@@ -0,0 +1,124 @@
+"""Shared fixtures for the benchmarks: a synthetic tracker workbook, a matching config and null collaborators."""
+import sys
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.filters import CustomFilter, CustomFilters, FilterColumn
+
+from template_management.compiled_template import TemplateCache
+
+SHEET_NAME = 'TRACKER'
+HEADERS = ['PO number / Action Number', 'Supplied Contact', 'ITEM LOCATION / ADDRESS', 'Review 1',
+           '1ST ACCESS LETTER DATE/CALL ', '2ND ACCESS LETTER DATE/CALL', '3RD ACCESS LETTER DATE/CALL',
+           'ORDER STATUS', 'TYPE OF WORKS']
+ORDER_STATUSES = ['LIVE', 'LIVE', 'CLOSED', 'ON HOLD']
+WORK_TYPES = ['FED', 'FD-30', 'FED', 'GLAZING', 'FD-60']
+SENT_VALUE = 'sent letter 01 January 2024'
+
+
+class NullLogger:
+    def log(self, level, message, *args):
+        pass
+
+    def start_run(self):
+        pass
+
+    def span(self, stage):
+        return nullcontext()
+
+    def record(self, stage, seconds):
+        pass
+
+    def add_rows(self, count):
+        pass
+
+    def export_metrics(self, path=None):
+        return None
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB, or None if it cannot be measured here.
+
+    Uses resource on Unix and psutil, when installed, on Windows.
+    """
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def build_config(file_path, **overrides):
+    config = SimpleNamespace(
+        LOCAL_EXCEL_FILE=file_path, EXCEL_SHEET_NAME=SHEET_NAME, HEADER_ROW=1,
+        ADDRESS_COLUMN=HEADERS[2], NAME_COLUMN=HEADERS[1], WORK_ORDER_COLUMN=HEADERS[0],
+        LETTER_1_COLUMN=HEADERS[4], LETTER_2_COLUMN=HEADERS[5], LETTER_3_COLUMN=HEADERS[6],
+        REVIEW_COLUMN=HEADERS[3], REVIEW_POSITIVE_VALUE='A NEW DOOR/S REQUIRED',
+        TEMPLATE_GROUP1={'LETTER_1_TEMPLATE': 'template1', 'LETTER_2_TEMPLATE': 'template2',
+                         'LETTER_3_TEMPLATE': 'template3'},
+        TEMPLATE_GROUP2={'LETTER_1_TEMPLATE': 'template1A', 'LETTER_2_TEMPLATE': 'template2A',
+                         'LETTER_3_TEMPLATE': 'template3A'},
+        PLACEHOLDERS={'NAME_PLACEHOLDER': HEADERS[1], 'ADDRESS_PLACEHOLDER': HEADERS[2],
+                      'DATE_PLACEHOLDER': 'Date', 'WO': HEADERS[0]},
+        TEMPLATES_DIR='templates', PRINT_SERVER_DIR='print_server',
+        LOGGING_ENABLED=False,
+    )
+    config.__dict__.update(overrides)
+    return config
+
+
+def synthetic_row(i, letter_states=False):
+    """One tracker row; odd rows use template group 1. letter_states cycles 0-3 letters already sent."""
+    sent = (i // len(ORDER_STATUSES)) % 4 if letter_states else 0
+    letters = [SENT_VALUE if n < sent else None for n in range(3)]
+    return [f"WO{i:06d}", f"Mr Resident {i}", f"{i} Example Street, Town",
+            'A NEW DOOR/S REQUIRED' if i % 2 else '', *letters,
+            ORDER_STATUSES[i % len(ORDER_STATUSES)], WORK_TYPES[i % len(WORK_TYPES)]]
+
+
+def build_workbook(file_path, rows, auto_filter=False, letter_states=False):
+    """Write a synthetic tracker; auto_filter adds ORDER STATUS = LIVE and TYPE OF WORKS <> *-* filters."""
+    wb = Workbook(write_only=True)
+    sheet = wb.create_sheet(SHEET_NAME)
+    if auto_filter:
+        last_column = get_column_letter(len(HEADERS))
+        sheet.auto_filter.ref = f"A1:{last_column}{rows + 1}"
+        sheet.auto_filter.add_filter_column(HEADERS.index('ORDER STATUS'), ['LIVE'])
+        work_type = FilterColumn(colId=HEADERS.index('TYPE OF WORKS'),
+                                 customFilters=CustomFilters(customFilter=[CustomFilter(operator='notEqual',
+                                                                                        val='*-*')]))
+        sheet.auto_filter.filterColumn.append(work_type)
+    sheet.append(HEADERS)
+    for i in range(rows):
+        sheet.append(synthetic_row(i, letter_states))
+    wb.save(file_path)
+
+
+def build_records(rows, letter_states=False):
+    return [dict(zip(HEADERS, synthetic_row(i, letter_states))) for i in range(rows)]
+
+
+def unfilled_placeholders(file_path):
+    """Return the {{...}} tags still present in a saved letter, body and tables included."""
+    from docx import Document
+    from template_management.compiled_template import PLACEHOLDER_PATTERN, iter_paragraphs
+    return [tag for paragraph in iter_paragraphs(Document(file_path))
+            for tag in PLACEHOLDER_PATTERN.findall(paragraph.text)]
+
+
+def make_template_manager(config):
+    """Build a TemplateManager without reading default_config.json from the working directory."""
+    from template_management.template_manager import TemplateManager
+    manager = TemplateManager.__new__(TemplateManager)
+    manager.config = config
+    manager.logger = NullLogger()
+    manager.write_back_session = None
+    manager.template_cache = TemplateCache(config.TEMPLATES_DIR, manager.logger)
+    return manager
@@ -0,0 +1,70 @@
+"""Compare the per-letter update_excel path with the batched write-back session.
+
+Run from the project root:  python -m benchmarks.excel_write_back_benchmark --rows 5000 --updates 200
+"""
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.common import HEADERS, build_config, build_workbook, make_template_manager
+
+
+def updates_for(rows, count):
+    step = max(rows // count, 1)
+    return [{HEADERS[2]: f"{i} Example Street, Town"} for i in range(0, rows, step)][:count]
+
+
+def run_per_letter(config, updates):
+    manager = make_template_manager(config)
+    start = time.perf_counter()
+    for data in updates:
+        manager.update_excel(data, 'template1')
+    return time.perf_counter() - start
+
+
+def run_session(config, updates, batch_size):
+    manager = make_template_manager(config)
+    start = time.perf_counter()
+    manager.open_write_back_session(batch_size)
+    try:
+        for data in updates:
+            manager.update_excel(data, 'template1')
+    finally:
+        manager.close_write_back_session()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel write-back benchmark")
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--updates', type=int, default=100)
+    parser.add_argument('--batch-size', type=int, default=100)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    work_dir = tempfile.mkdtemp(prefix='excel_bench_')
+    try:
+        source = os.path.join(work_dir, 'source.xlsx')
+        build_workbook(source, args.rows)
+        updates = updates_for(args.rows, args.updates)
+
+        results = {}
+        for name, runner in (('per-letter', lambda c: run_per_letter(c, updates)),
+                             ('session', lambda c: run_session(c, updates, args.batch_size))):
+            target = os.path.join(work_dir, f"{name}.xlsx")
+            shutil.copyfile(source, target)
+            results[name] = runner(build_config(target))
+
+        print(f"rows={args.rows} updates={len(updates)} batch_size={args.batch_size}")
+        for name, elapsed in results.items():
+            print(f"{name:>10}: {elapsed:8.2f}s  ({len(updates) / elapsed:8.1f} updates/s)")
+        print(f"speedup: {results['per-letter'] / results['session']:.1f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
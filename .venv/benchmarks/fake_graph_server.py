@@ -0,0 +1,126 @@
+"""Local stand-in for the Microsoft Graph drive item and workbook endpoints the watcher uses.
+
+Serves one worksheet held in memory; edit it with set_cell() and the item's eTag/cTag change like they
+would on SharePoint. throttle_every makes every Nth request answer 429 with Retry-After, and tokens listed in
+expired_tokens get 401, so retry and token refresh paths can be exercised.
+"""
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import range_boundaries
+
+
+class FakeGraphServer:
+    def __init__(self, sheet_name, values, host='127.0.0.1', port=0, throttle_every=0, retry_after='0'):
+        self.sheet_name = sheet_name
+        self.values = values
+        self.version = 1
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.expired_tokens = set()
+        self.total_requests = 0
+        self.requests = {}
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1.0"
+
+    def set_cell(self, row, column, value):
+        """Change a cell (0-based indexes into values) and bump the item's version tags."""
+        with self.lock:
+            self.values[row][column] = value
+            self.version += 1
+
+    def count(self, kind):
+        return self.requests.get(kind, 0)
+
+    def used_range(self, address_only=False):
+        width = max((len(row) for row in self.values), default=1)
+        address = f"{self.sheet_name}!A1:{get_column_letter(width)}{max(len(self.values), 1)}"
+        if address_only:
+            return {"address": address}
+        return {"address": address, "values": [list(row) + [''] * (width - len(row)) for row in self.values]}
+
+    def range_values(self, address):
+        min_col, min_row, max_col, max_row = range_boundaries(address)
+        rows = []
+        for row in self.values[min_row - 1:max_row]:
+            padded = list(row) + [''] * (max_col - len(row))
+            rows.append(padded[min_col - 1:max_col])
+        return {"address": f"{self.sheet_name}!{address}", "values": rows}
+
+    def _reply(self, handler, status, body, headers=None):
+        payload = json.dumps(body, default=str).encode('utf-8')
+        handler.send_response(status)
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path = unquote(parsed.path)
+                query = parse_qs(parsed.query)
+                with server.lock:
+                    server.total_requests += 1
+                    throttled = server.throttle_every and server.total_requests % server.throttle_every == 0
+                token = self.headers.get('Authorization', '').replace('Bearer ', '', 1)
+                if token in server.expired_tokens:
+                    server._reply(self, 401, {"error": {"code": "InvalidAuthenticationToken"}})
+                    return
+                if throttled:
+                    server._reply(self, 429, {"error": {"code": "TooManyRequests"}},
+                                  {'Retry-After': server.retry_after})
+                    return
+                range_match = re.search(r"/worksheets/[^/]+/range\(address='([^']+)'\)$", path)
+                if range_match:
+                    kind, body = 'range', server.range_values(range_match.group(1))
+                elif re.search(r'/worksheets/[^/]+/usedRange(\(valuesOnly=(true|false)\))?$', path):
+                    kind, body = 'usedRange', server.used_range(address_only=query.get('$select') == ['address'])
+                elif path.endswith('/workbook/worksheets'):
+                    kind, body = 'worksheets', {"value": [{"id": "{sheet-1}", "name": server.sheet_name}]}
+                elif re.search(r'/drives/[^/]+/items/[^/]+$', path):
+                    kind = 'item'
+                    body = {"id": path.rsplit('/', 1)[-1], "eTag": f'"{{ITEM}},{server.version}"',
+                            "cTag": f'"c:{{ITEM}},{server.version}"'}
+                else:
+                    self.send_error(404)
+                    return
+                with server.lock:
+                    server.requests[kind] = server.requests.get(kind, 0) + 1
+                server._reply(self, 200, body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
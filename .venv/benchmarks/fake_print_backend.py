@@ -0,0 +1,23 @@
+"""A print backend that stands in for Word and a printer in the benchmarks."""
+import threading
+import time
+
+from printing.backends import PrintBackend
+
+
+class FakePrintBackend(PrintBackend):
+    """Sleeps per batch and per document to simulate a print queue, and records what was printed."""
+
+    def __init__(self, batch_latency=0.0, document_latency=0.0):
+        self.batch_latency = batch_latency
+        self.document_latency = document_latency
+        self.printed = []
+        self.batches = 0
+        self.lock = threading.Lock()
+
+    def print_batch(self, paths):
+        time.sleep(self.batch_latency + self.document_latency * len(paths))
+        with self.lock:
+            self.printed.extend(paths)
+            self.batches += 1
+        return {}
@@ -0,0 +1,102 @@
+"""Check autoFilter evaluation in DataCollector.collect_data against what Excel shows.
+
+Builds small trackers with known filters (date comparisons, an autoFilter that does not start in column A)
+and compares the surviving rows with the expected ones. Run from the project root:
+    python -m benchmarks.filter_check
+"""
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+
+from openpyxl import Workbook
+from openpyxl.worksheet.filters import CustomFilter, CustomFilters, FilterColumn, Filters
+
+from benchmarks.common import build_config, NullLogger, SHEET_NAME
+
+DATES = {'before': datetime(2023, 12, 31), 'on': datetime(2024, 1, 1), 'after': datetime(2024, 1, 2), 'blank': None}
+SERIAL = '45292'  # 2024-01-01 as Excel stores it in the filter
+DATE_CASES = {
+    'greaterThan': ['after'],
+    'greaterThanOrEqual': ['on', 'after'],
+    'lessThan': ['before'],
+    'lessThanOrEqual': ['before', 'on'],
+    'equal': ['on'],
+    'notEqual': ['before', 'after', 'blank'],
+}
+BLANK_CASES = {  # Filters Excel writes for (Blanks) / (NonBlanks) on a date column
+    'custom notEqual " "': (CustomFilters(customFilter=[CustomFilter(operator='notEqual', val=' ')]), None,
+                            ['before', 'on', 'after']),
+    'custom equal ""': (CustomFilters(customFilter=[CustomFilter(operator='equal', val='')]), None, ['blank']),
+    'values blank': (None, Filters(blank=True), ['blank']),
+}
+
+
+def collect(file_path, **overrides):
+    from data_collection.data_collector import DataCollector
+    return DataCollector(NullLogger(), build_config(file_path, **overrides)).collect_data()
+
+
+def date_filter_workbook(file_path, custom_filters=None, filters=None):
+    wb = Workbook()
+    sheet = wb.active
+    sheet.title = SHEET_NAME
+    sheet.append(['Label', 'Visit date'])
+    for label, value in DATES.items():
+        sheet.append([label, value])
+    sheet.auto_filter.ref = f"A1:B{len(DATES) + 1}"
+    sheet.auto_filter.filterColumn.append(FilterColumn(colId=1, customFilters=custom_filters, filters=filters))
+    wb.save(file_path)
+
+
+def check_offset_ref(work_dir):
+    """An autoFilter over B2:D5 with colId=1 filters column C, not B."""
+    file_path = os.path.join(work_dir, 'offset.xlsx')
+    wb = Workbook()
+    sheet = wb.active
+    sheet.title = SHEET_NAME
+    sheet.append([])
+    sheet.append([None, 'Label', 'Status', 'Notes'])
+    for label, status in (('first', 'LIVE'), ('second', 'CLOSED'), ('third', 'LIVE')):
+        sheet.append([None, label, status, ''])
+    sheet.auto_filter.ref = 'B2:D5'
+    sheet.auto_filter.add_filter_column(1, ['LIVE'])
+    wb.save(file_path)
+    got = list(collect(file_path, HEADER_ROW=2)['Label'])
+    if got != ['first', 'third']:
+        return [f"colId=1 in B2:D5 should filter column C: expected ['first', 'third'], got {got}"]
+    return []
+
+
+def check_date_operators(work_dir):
+    problems = []
+    for operator, expected in DATE_CASES.items():
+        file_path = os.path.join(work_dir, f'dates_{operator}.xlsx')
+        date_filter_workbook(file_path, CustomFilters(customFilter=[CustomFilter(operator=operator, val=SERIAL)]))
+        got = list(collect(file_path)['Label'])
+        if got != expected:
+            problems.append(f"{operator} {SERIAL} on a date column: expected {expected}, got {got}")
+    for idx, (label, (custom_filters, filters, expected)) in enumerate(BLANK_CASES.items()):
+        file_path = os.path.join(work_dir, f'blanks_{idx}.xlsx')
+        date_filter_workbook(file_path, custom_filters, filters)
+        got = list(collect(file_path)['Label'])
+        if got != expected:
+            problems.append(f"{label} on a date column with a blank: expected {expected}, got {got}")
+    return problems
+
+
+def main():
+    work_dir = tempfile.mkdtemp(prefix='filter_check_')
+    try:
+        problems = check_date_operators(work_dir) + check_offset_ref(work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    for problem in problems:
+        print(f"FAIL {problem}")
+    print(f"{len(problems)} problem(s)")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Measure LLM name/address normalisation against a local fake OpenAI server.
+
+Compares one blocking call per placeholder per letter with the cached, concurrently pre-resolved path,
+cold, warm, and again with the cold normalizer as a second watch tick would.
+Run from the project root:  python -m benchmarks.llm_cache_benchmark --rows 200
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from types import SimpleNamespace
+
+from openai import OpenAI
+
+from benchmarks.common import NullLogger
+from benchmarks.fake_openai_server import FakeOpenAIServer
+from letter_generation.llm_cache import LLMResponseCache
+from letter_generation.text_normalizer import TextNormalizer, NAME, ADDRESS
+
+
+def build_rows(rows, unique_residents):
+    return [{'Supplied Contact': f"Mr Resident {i % unique_residents}",
+             'ITEM LOCATION / ADDRESS': f"{i % unique_residents} Example Street, Town"} for i in range(rows)]
+
+
+def render_all(normalizer, rows, config):
+    for data in rows:
+        normalizer.normalize(NAME, data[config.NAME_COLUMN])
+        normalizer.normalize(ADDRESS, data[config.ADDRESS_COLUMN])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM normalisation cache benchmark")
+    parser.add_argument('--rows', type=int, default=200)
+    parser.add_argument('--unique', type=int, default=80, help="Number of distinct residents among the rows")
+    parser.add_argument('--latency', type=float, default=0.05, help="Fake server latency per request in seconds")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--rps', type=float, default=0, help="Request rate limit (0 disables)")
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows, args.unique)
+    work_dir = tempfile.mkdtemp(prefix='llm_bench_')
+    try:
+        with FakeOpenAIServer(latency=args.latency) as server:
+            client = OpenAI(api_key='fake-key', base_url=server.base_url)
+            config = SimpleNamespace(NAME_COLUMN='Supplied Contact', ADDRESS_COLUMN='ITEM LOCATION / ADDRESS',
+                                     LLM_CONCURRENCY=args.concurrency, LLM_REQUESTS_PER_SECOND=args.rps)
+
+            # Uncached: a throwaway cache per call reproduces the old one-request-per-placeholder behaviour.
+            start = time.perf_counter()
+            for data in rows:
+                for kind, column in ((NAME, config.NAME_COLUMN), (ADDRESS, config.ADDRESS_COLUMN)):
+                    scratch = TextNormalizer(config, NullLogger(), client, LLMResponseCache(':memory:'))
+                    scratch.normalize(kind, data[column])
+            uncached = time.perf_counter() - start
+            uncached_requests = server.request_count
+
+            db_path = os.path.join(work_dir, 'cache.sqlite')
+            results = {}
+            normalizers = {}
+            for label in ('cold', 'warm', 'rerun'):
+                if label == 'rerun':  # The cold normalizer again, like the next watch tick in the same process
+                    normalizer = normalizers['cold']
+                else:
+                    normalizer = TextNormalizer(config, NullLogger(), client, LLMResponseCache(db_path))
+                    normalizers[label] = normalizer
+                before = server.request_count
+                start = time.perf_counter()
+                normalizer.start_run()
+                normalizer.pre_resolve(rows)
+                render_all(normalizer, rows, config)
+                results[label] = (time.perf_counter() - start, server.request_count - before, normalizer.stats())
+            for normalizer in normalizers.values():
+                normalizer.cache.close()
+
+        print(f"rows={args.rows} unique={args.unique} latency={args.latency}s concurrency={args.concurrency}")
+        print(f"  uncached: {uncached:7.2f}s  requests={uncached_requests}")
+        for label, (elapsed, requests, stats) in results.items():
+            print(f"  {label:>8}: {elapsed:7.2f}s  requests={requests}  hit_rate={stats['hit_rate']:.1%}  "
+                  f"time_saved_vs_uncached={uncached - elapsed:.2f}s")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
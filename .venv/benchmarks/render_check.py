@@ -0,0 +1,65 @@
+"""Render every template through CompiledTemplate, save it, reopen it and check the result.
+
+Fails if any {{...}} tag survives the round trip, or if a tag split across runs loses the formatting of the
+run it started in. Checks the sample templates and the project's own templates/. Run from the project root:
+    python -m benchmarks.render_check
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+from docx import Document
+
+from benchmarks.common import unfilled_placeholders
+from benchmarks.sample_templates import TEMPLATE_NAMES, build_templates
+from template_management.compiled_template import CompiledTemplate
+
+VALUES = {'WO': 'WO000042', 'NAME_PLACEHOLDER': 'Mr Resident 42',
+          'ADDRESS_PLACEHOLDER': '42 Example Street\nTown', 'DATE_PLACEHOLDER': '01 January 2024'}
+
+
+def check_template(path, out_path):
+    problems = []
+    CompiledTemplate(path).render(VALUES).save(out_path)
+    left = unfilled_placeholders(out_path)
+    if left:
+        problems.append(f"{path}: unfilled placeholders {left}")
+    return problems
+
+
+def check_split_run_formatting(templates_dir, out_path):
+    """The sample greeting is 'Dear ' + bold '{{NAME_' + 'PLACEHOLDER}},'; the name must land in the bold run."""
+    CompiledTemplate(os.path.join(templates_dir, 'template1.docx')).render(VALUES).save(out_path)
+    for paragraph in Document(out_path).paragraphs:
+        if paragraph.text.startswith('Dear '):
+            runs = [(run.text, bool(run.bold)) for run in paragraph.runs]
+            if runs[:2] != [('Dear ', False), (VALUES['NAME_PLACEHOLDER'], True)]:
+                return [f"split placeholder lost its run formatting: {runs}"]
+            return []
+    return ["greeting paragraph not found"]
+
+
+def main():
+    work_dir = tempfile.mkdtemp(prefix='render_check_')
+    try:
+        templates_dir = build_templates(os.path.join(work_dir, 'templates'))
+        paths = [os.path.join(templates_dir, f'{name}.docx') for name in TEMPLATE_NAMES]
+        if os.path.isdir('templates'):
+            paths += [os.path.join('templates', name) for name in sorted(os.listdir('templates'))
+                      if name.endswith('.docx')]
+        problems = []
+        for idx, path in enumerate(paths):
+            problems += check_template(path, os.path.join(work_dir, f'letter_{idx}.docx'))
+        problems += check_split_run_formatting(templates_dir, os.path.join(work_dir, 'formatting.docx'))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for problem in problems:
+        print(f"FAIL {problem}")
+    print(f"{len(paths)} template(s) checked, {len(problems)} problem(s)")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
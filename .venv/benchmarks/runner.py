@@ -0,0 +1,349 @@
+"""Offline benchmark suite: times the main stages against synthetic trackers and checks them against a baseline.
+
+Everything runs locally: a generated tracker with autoFilters and letters in mixed states, sample templates
+for both template groups, the fake OpenAI server and a fake print backend. Each scenario runs --repeat times,
+each in a fresh process so peak RSS is measured independently, and the median run is reported. Run from the
+project root:
+    python -m benchmarks.runner --rows 1000 10000 100000
+    python -m benchmarks.runner --rows 1000 10000 --save-baseline
+Results are written to --results; the run exits with status 1 if any scenario's throughput drops, or its
+peak RSS grows, by more than --threshold relative to the stored baseline, or if the baseline was recorded
+with different settings.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from benchmarks.common import (build_config, build_records, build_workbook, make_template_manager, NullLogger,
+                               peak_rss_mb, unfilled_placeholders)
+from benchmarks.sample_templates import build_templates
+from custom_logging.instrumentation import Instrumentation, percentile
+
+SCENARIOS = ['collect_data', 'determine_next_letter', 'update_excel', 'render_letter',
+             'generate_and_print_letters']
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# Settings that change what a scenario measures; results are only comparable when these match the baseline's
+COMPARED_SETTINGS = ['repeat', 'render_rows', 'e2e_rows', 'workers', 'llm_latency', 'printer_latency',
+                     'print_batch_size']
+
+
+class MetricsLogger(NullLogger):
+    """Discards messages but keeps stage timings, so end-to-end runs can report per-stage latency."""
+
+    def __init__(self):
+        self.instrumentation = Instrumentation()
+
+    def span(self, stage):
+        return self.instrumentation.span(stage)
+
+    def record(self, stage, seconds):
+        self.instrumentation.record(stage, seconds)
+
+    def add_rows(self, count):
+        self.instrumentation.add_rows(count)
+
+
+def scenario_config(work_dir, source_workbook, templates_dir, name):
+    """Give each scenario run its own copy of the tracker, print directory and LLM cache."""
+    scenario_dir = os.path.join(work_dir, name)
+    os.makedirs(os.path.join(scenario_dir, 'print_server'), exist_ok=True)
+    workbook_path = os.path.join(scenario_dir, 'tracker.xlsx')
+    shutil.copy2(source_workbook, workbook_path)
+    return build_config(workbook_path, TEMPLATES_DIR=templates_dir,
+                        PRINT_SERVER_DIR=os.path.join(scenario_dir, 'print_server'),
+                        LLM_CACHE_PATH=os.path.join(scenario_dir, 'llm_cache.sqlite'),
+                        LLM_CONCURRENCY=32, LLM_REQUESTS_PER_SECOND=0)
+
+
+def timed_calls(calls):
+    """Run each zero-argument call, returning (total seconds, per-call latencies)."""
+    latencies = []
+    start = time.perf_counter()
+    for call in calls:
+        call_start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - call_start)
+    return time.perf_counter() - start, latencies
+
+
+def letters_due(manager, records):
+    due = []
+    for data in records:
+        template_name = manager.determine_next_letter(data)
+        if template_name:
+            due.append((data, template_name))
+    return due
+
+
+def check_letters(print_server_dir):
+    """Raise if any saved letter still contains a {{...}} tag."""
+    unfilled = {}
+    for name in sorted(os.listdir(print_server_dir)):
+        tags = unfilled_placeholders(os.path.join(print_server_dir, name))
+        if tags:
+            unfilled[name] = tags
+    if unfilled:
+        name, tags = next(iter(unfilled.items()))
+        raise AssertionError(f"{len(unfilled)} letter(s) with unfilled placeholders, e.g. {name}: {tags}")
+
+
+def make_generator(config, logger, printer, manager, server):
+    from letter_generation.letter_generator import LetterGenerator
+    generator = LetterGenerator(config, logger, printer, manager)
+    generator.normalizer.client = generator.normalizer.client.with_options(base_url=server.base_url)
+    return generator
+
+
+def bench_collect_data(config, options):
+    from data_collection.data_collector import DataCollector
+    collector = DataCollector(NullLogger(), config)
+    result = {}
+    seconds, latencies = timed_calls([lambda: result.setdefault('df', collector.collect_data())])
+    return {'items': options.rows, 'seconds': seconds, 'latencies': latencies, 'filtered_rows': len(result['df'])}
+
+
+def bench_determine_next_letter(config, options):
+    manager = make_template_manager(config)
+    records = build_records(options.rows, letter_states=True)
+    seconds, latencies = timed_calls([lambda data=data: manager.determine_next_letter(data) for data in records])
+    return {'items': len(records), 'seconds': seconds, 'latencies': latencies}
+
+
+def bench_update_excel(config, options):
+    """Every due letter is recorded through one write-back session; open and final save are included."""
+    manager = make_template_manager(config)
+    due = letters_due(manager, build_records(options.rows, letter_states=True))
+    start = time.perf_counter()
+    manager.open_write_back_session()
+    try:
+        _, latencies = timed_calls([lambda data=data, name=name: manager.update_excel(data, name)
+                                    for data, name in due])
+    finally:
+        manager.close_write_back_session()
+    return {'items': len(due), 'seconds': time.perf_counter() - start, 'latencies': latencies}
+
+
+def bench_render_letter(config, options):
+    """Renders through the compiled template cache, as production does; names and addresses are resolved
+    against the fake LLM beforehand. Saving is not timed, but every saved letter is checked for leftover tags.
+    """
+    from benchmarks.fake_openai_server import FakeOpenAIServer
+    manager = make_template_manager(config)
+    due = letters_due(manager, build_records(options.rows, letter_states=True))[:options.render_rows]
+    with FakeOpenAIServer(latency=options.llm_latency) as server:
+        generator = make_generator(config, NullLogger(), None, manager, server)
+        generator.normalizer.pre_resolve([data for data, _ in due])
+        latencies = []
+        for idx, (data, name) in enumerate(due):
+            start = time.perf_counter()
+            document = generator.render_letter(name, data)
+            latencies.append(time.perf_counter() - start)
+            document.save(os.path.join(config.PRINT_SERVER_DIR, f'letter_{idx}.docx'))
+    check_letters(config.PRINT_SERVER_DIR)
+    return {'items': len(due), 'seconds': sum(latencies), 'latencies': latencies}
+
+
+def bench_generate_and_print_letters(config, options):
+    """Full run over the first e2e_rows filtered rows, including LLM calls, printing and Excel write-back.
+
+    Latency is per letter, from being queued for printing to the fake printer finishing it.
+    """
+    from benchmarks.fake_openai_server import FakeOpenAIServer
+    from benchmarks.fake_print_backend import FakePrintBackend
+    from data_collection.data_collector import DataCollector
+    from printing.printer import Printer
+
+    records = DataCollector(NullLogger(), config).collect_data().head(options.e2e_rows).to_dict(orient='records')
+    logger = MetricsLogger()
+    manager = make_template_manager(config)
+    manager.logger = logger
+    backend = FakePrintBackend(document_latency=options.printer_latency)
+    printer = Printer(config.PRINT_SERVER_DIR, logger, backend=backend, batch_size=options.print_batch_size)
+    with FakeOpenAIServer(latency=options.llm_latency) as server:
+        generator = make_generator(config, logger, printer, manager, server)
+        start = time.perf_counter()
+        try:
+            generator.generate_and_print_letters(records, workers=options.workers)
+        finally:
+            printer.close()
+        seconds = time.perf_counter() - start
+    check_letters(config.PRINT_SERVER_DIR)
+    stages = logger.instrumentation.summary()['stages']
+    return {'items': len(records), 'seconds': seconds, 'latencies': logger.instrumentation.timings.get('print', []),
+            'printed': len(backend.printed),
+            'stages': {stage: {'p50_ms': stats['p50'] * 1000, 'p95_ms': stats['p95'] * 1000}
+                       for stage, stats in stages.items()}}
+
+
+def measure(name, config, options, results):
+    """Subprocess entry point: run one scenario and report its timings and this process's peak RSS."""
+    try:
+        raw = globals()[f'bench_{name}'](config, options)
+    except Exception as e:
+        results.put({'error': f'{type(e).__name__}: {e}'})
+        return
+    latencies = sorted(raw.pop('latencies'))
+    result = {
+        'rows': options.rows,
+        'items': raw.pop('items'),
+        'seconds': raw.pop('seconds'),
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    result['throughput'] = result['items'] / result['seconds'] if result['seconds'] else 0.0
+    result.update(raw)
+    results.put(result)
+
+
+def run_size(rows, args, context):
+    work_dir = tempfile.mkdtemp(prefix='bench_suite_')
+    try:
+        workbook_path = os.path.join(work_dir, 'tracker.xlsx')
+        build_workbook(workbook_path, rows, auto_filter=True, letter_states=True)
+        templates_dir = build_templates(os.path.join(work_dir, 'templates'))
+        options = SimpleNamespace(rows=rows, render_rows=args.render_rows, e2e_rows=args.e2e_rows,
+                                  workers=args.workers, llm_latency=args.llm_latency,
+                                  printer_latency=args.printer_latency, print_batch_size=args.print_batch_size)
+        measured = {}
+        for name in args.scenarios:
+            runs = []
+            for run in range(args.repeat):
+                config = scenario_config(work_dir, workbook_path, templates_dir, f'{name}_{run}')
+                results = context.Queue()
+                process = context.Process(target=measure, args=(name, config, options, results))
+                process.start()
+                runs.append(results.get())
+                process.join()
+                if 'error' in runs[-1]:
+                    break
+            result = median_run(runs)
+            measured[f'{name}@{rows}'] = result
+            if 'error' in result:
+                print(f"{name:>27} @ {rows:>6}: FAILED {result['error']}")
+            else:
+                print(f"{name:>27} @ {rows:>6}: {result['seconds']:8.2f}s  {result['throughput']:10.1f} items/s  "
+                      f"p50 {result['p50_ms']:8.3f}ms  p95 {result['p95_ms']:8.3f}ms  max {result['max_ms']:9.3f}ms  "
+                      f"peak RSS {format_mb(result['peak_rss_mb'])}")
+        return measured
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def median_run(runs):
+    """Report the run with the median throughput and the median peak RSS; any failed run fails the scenario."""
+    for run in runs:
+        if 'error' in run:
+            return run
+    ordered = sorted(runs, key=lambda run: run['throughput'])
+    result = dict(ordered[(len(ordered) - 1) // 2])
+    rss = sorted(run['peak_rss_mb'] for run in runs if run['peak_rss_mb'] is not None)
+    result['peak_rss_mb'] = rss[(len(rss) - 1) // 2] if rss else None
+    result['runs'] = len(runs)
+    result['throughput_runs'] = [run['throughput'] for run in runs]
+    return result
+
+
+def settings_mismatch(settings, baseline_settings):
+    """Return a message per compared setting that differs from the baseline's."""
+    return [f"{key}={settings.get(key)!r} but the baseline used {baseline_settings.get(key)!r}"
+            for key in COMPARED_SETTINGS if settings.get(key) != baseline_settings.get(key)]
+
+
+def format_mb(value):
+    return '      n/a' if value is None else f"{value:7.1f}MB"
+
+
+def compare(results, baseline, threshold):
+    """Return a message per scenario whose throughput or peak RSS regressed beyond threshold."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None or 'error' in base or 'error' in result:
+            continue
+        if result['throughput'] < base['throughput'] * (1 - threshold):
+            regressions.append(f"{key}: throughput {result['throughput']:.1f}/s vs baseline "
+                               f"{base['throughput']:.1f}/s")
+        if None in (result['peak_rss_mb'], base['peak_rss_mb']):
+            continue
+        if result['peak_rss_mb'] > base['peak_rss_mb'] * (1 + threshold):
+            regressions.append(f"{key}: peak RSS {result['peak_rss_mb']:.1f}MB vs baseline "
+                               f"{base['peak_rss_mb']:.1f}MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark suite with baseline regression check")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument('--render-rows', type=int, default=200, help="letters rendered by render_letter")
+    parser.add_argument('--e2e-rows', type=int, default=200, help="rows sent through generate_and_print_letters")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--llm-latency', type=float, default=0.01)
+    parser.add_argument('--printer-latency', type=float, default=0.0)
+    parser.add_argument('--print-batch-size', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5, help="runs per scenario; the median is reported")
+    parser.add_argument('--results', default='benchmark_results.json')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed fractional regression")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    os.environ.setdefault('OPENAI_API_KEY', 'fake-key')
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for rows in args.rows:
+        results.update(run_size(rows, args, context))
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'settings': {key: value for key, value in vars(args).items()
+                     if key not in ('results', 'baseline', 'save_baseline')},
+        'results': results,
+    }
+    with open(args.results, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.results}")
+
+    failed = [key for key, result in results.items() if 'error' in result]
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        mismatched = settings_mismatch(report['settings'], baseline.get('settings', {}))
+        for message in mismatched:
+            print(f"NOT COMPARABLE {message}")
+        if mismatched:
+            print(f"Not comparing against {args.baseline}; rerun with its settings or use --save-baseline")
+            failed += mismatched
+        else:
+            regressions = compare(results, baseline['results'], args.threshold)
+            for message in regressions:
+                print(f"REGRESSION {message}")
+            if not regressions:
+                print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+            failed += regressions
+    else:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
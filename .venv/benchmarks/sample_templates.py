@@ -0,0 +1,38 @@
+"""Sample letter templates for the benchmarks, shaped like the real ones in templates/."""
+import os
+
+from docx import Document
+
+TEMPLATE_NAMES = ['template1', 'template2', 'template3', 'template1A', 'template2A', 'template3A']
+BODY_PARAGRAPHS = 20
+
+
+def build_template(file_path, title):
+    """Write a letter with placeholders in body paragraphs, split across runs, and in a table."""
+    document = Document()
+    document.add_paragraph('Our Ref:   {{WO}}')
+    document.add_paragraph('{{ADDRESS_PLACEHOLDER}}')
+    document.add_paragraph('{{DATE_PLACEHOLDER}}')
+    greeting = document.add_paragraph('Dear ')
+    greeting.add_run('{{NAME_').bold = True  # Tag split across runs, as Word often saves them
+    greeting.add_run('PLACEHOLDER}},')
+    document.add_heading(title, level=2)
+    for i in range(BODY_PARAGRAPHS):
+        document.add_paragraph(f'Paragraph {i + 1} of the notice. Please contact us quoting {{{{WO}}}} '
+                               f'if you have any questions about the works at your property.')
+
+    table = document.add_table(rows=3, cols=2)
+    for row, (label, value) in zip(table.rows, [('Work order', '{{WO}}'), ('Resident', '{{NAME_PLACEHOLDER}}'),
+                                                ('Property', '{{ADDRESS_PLACEHOLDER}}')]):
+        row.cells[0].text = label
+        row.cells[1].text = value
+    document.add_paragraph('Yours sincerely,')
+    document.save(file_path)
+
+
+def build_templates(templates_dir, names=TEMPLATE_NAMES):
+    """Write one sample template per name into templates_dir and return the directory."""
+    os.makedirs(templates_dir, exist_ok=True)
+    for name in names:
+        build_template(os.path.join(templates_dir, f'{name}.docx'), f'Fire safety works notice ({name})')
+    return templates_dir
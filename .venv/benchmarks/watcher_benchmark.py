@@ -0,0 +1,96 @@
+"""Exercise the incremental watcher against the fake Graph server and a local workbook.
+
+Prints rows examined versus rows processed for each tick. Run from the project root:
+    python -m benchmarks.watcher_benchmark --rows 5000 --edits 25
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from openpyxl import load_workbook
+
+from benchmarks.common import HEADERS, SHEET_NAME, NullLogger, build_config, build_workbook, synthetic_row
+from benchmarks.fake_graph_server import FakeGraphServer
+from data_collection.data_collector import DataCollector
+from watcher.teams_excel_watcher import TeamsExcelWatcher
+
+
+class FakeApp:
+    def acquire_token_for_client(self, scopes):
+        return {'access_token': 'fake-token', 'expires_in': 3600}
+
+
+class RecordingGenerator:
+    def __init__(self):
+        self.rows = []
+
+    def generate_and_print_letters(self, data_list, workers=None):
+        self.rows.extend(data_list)
+        return []
+
+
+def make_watcher(config, generator):
+    return TeamsExcelWatcher(DataCollector(NullLogger(), config), NullLogger(), 'tenant', 'client', 'secret',
+                             'item-1', 'drive-1', config=config, letter_generator=generator, app=FakeApp())
+
+
+def tick(label, watcher):
+    start = time.perf_counter()
+    stats = watcher.check_for_changes()
+    print(f"  {label:<28} examined={stats['examined']:>6}  processed={stats['processed']:>6}  "
+          f"{time.perf_counter() - start:6.2f}s")
+
+
+def run_remote(work_dir, rows, edits):
+    print("remote (fake Graph server):")
+    values = [HEADERS] + [['' if v is None else v for v in synthetic_row(i)] for i in range(rows)]
+    with FakeGraphServer(SHEET_NAME, values) as server:
+        config = build_config('unused.xlsx', USE_TEAMS_EXCEL=True, GRAPH_BASE_URL=server.base_url,
+                              WATCHER_STATE_FILE=os.path.join(work_dir, 'remote_state.json'))
+        watcher = make_watcher(config, RecordingGenerator())
+        tick('first run', watcher)
+        tick('unchanged', watcher)
+        for i in range(edits):
+            server.set_cell(1 + i * max(rows // edits, 1), HEADERS.index('Review 1'), 'A NEW DOOR/S REQUIRED!')
+        tick(f'{edits} rows edited', watcher)
+        tick('restarted, unchanged', make_watcher(config, RecordingGenerator()))
+        print(f"  usedRange fetches: {server.count('usedRange')} of {server.count('item')} ticks")
+
+
+def run_local(work_dir, rows, edits):
+    print("local workbook:")
+    file_path = os.path.join(work_dir, 'tracker.xlsx')
+    build_workbook(file_path, rows)
+    config = build_config(file_path, USE_TEAMS_EXCEL=False,
+                          WATCHER_STATE_FILE=os.path.join(work_dir, 'local_state.json'))
+    watcher = make_watcher(config, RecordingGenerator())
+    tick('first run', watcher)
+    tick('unchanged', watcher)
+    os.utime(file_path)
+    tick('touched, same content', watcher)
+    wb = load_workbook(file_path)
+    sheet = wb[SHEET_NAME]
+    for i in range(edits):
+        sheet.cell(row=2 + i * max(rows // edits, 1), column=HEADERS.index('Review 1') + 1, value='CHANGED')
+    wb.save(file_path)
+    tick(f'{edits} rows edited', watcher)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental watcher benchmark")
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--edits', type=int, default=25)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='watcher_bench_')
+    try:
+        run_remote(work_dir, args.rows, args.edits)
+        run_local(work_dir, args.rows, args.edits)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
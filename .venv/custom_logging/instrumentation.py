@@ -0,0 +1,77 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+STAGES = ('data_load', 'filter', 'llm_prefetch', 'llm', 'render', 'save', 'print', 'excel_write')
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class Instrumentation:
+    """Collects per-stage timings for a run and summarises them as count/total/p50/p95/max plus rows/sec."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def start_run(self):
+        """Begin a new measurement window: clear timings and rows and restart the elapsed clock."""
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.timings = {}
+            self.rows = 0
+            self.started = time.perf_counter()
+
+    @contextmanager
+    def span(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage, seconds):
+        with self.lock:
+            self.timings.setdefault(stage, []).append(seconds)
+
+    def add_rows(self, count):
+        with self.lock:
+            self.rows += count
+
+    def summary(self):
+        with self.lock:
+            elapsed = time.perf_counter() - self.started
+            stages = {}
+            ordered = [stage for stage in STAGES if stage in self.timings]
+            ordered += sorted(stage for stage in self.timings if stage not in STAGES)
+            for stage in ordered:
+                values = sorted(self.timings[stage])
+                stages[stage] = {
+                    'count': len(values),
+                    'total': sum(values),
+                    'p50': percentile(values, 0.50),
+                    'p95': percentile(values, 0.95),
+                    'max': values[-1],
+                }
+            return {
+                'elapsed': elapsed,
+                'rows': self.rows,
+                'rows_per_sec': self.rows / elapsed if elapsed else 0.0,
+                'stages': stages,
+            }
+
+    def export(self, path):
+        """Write the summary as JSON to path and start a new measurement window."""
+        summary = self.summary()
+        with open(path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        self.reset()
+        return summary
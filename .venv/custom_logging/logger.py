@@ -0,0 +1,109 @@
+import atexit
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from custom_logging.instrumentation import Instrumentation
+
+LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
+
+_listener = None
+_instrumentation = Instrumentation()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, logger, level, message and any exception text."""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class RecordQueueHandler(QueueHandler):
+    """Enqueues records as they are, so the listener thread formats them and exc_info reaches the formatter."""
+
+    def prepare(self, record):
+        # The default prepare() formats in the calling thread and clears exc_info; the queue is in-process,
+        # so the record never needs pickling.
+        return record
+
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class Logger:
+    def __init__(self, config, log_file='app.log', log_level=logging.INFO):
+        global _listener
+        self.config = config
+        self.logger = logging.getLogger('LetterAutomationLogger')
+        self.logger.setLevel(log_level)
+        self.instrumentation = _instrumentation  # Shared by every Logger, like the underlying logging.Logger
+        if not self.logger.hasHandlers():  # Check if handlers are already set
+            fh = RotatingFileHandler(log_file, maxBytes=1048576, backupCount=5)  # 1MB per file, max 5 files
+            fh.setLevel(log_level)
+            ch = logging.StreamHandler()
+            ch.setLevel(log_level)
+            if getattr(config, 'LOG_FORMAT', 'text') == 'json':
+                formatter = JsonFormatter()
+            else:
+                formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            fh.setFormatter(formatter)
+            ch.setFormatter(formatter)
+            # Callers only enqueue records; file and console I/O happen on the listener thread.
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(RecordQueueHandler(log_queue))
+            _listener = QueueListener(log_queue, fh, ch, respect_handler_level=True)
+            _listener.start()
+            atexit.register(_stop_listener)
+
+    def log(self, level, message, *args):
+        """Log message at level; %-style args are only formatted if the record is actually emitted."""
+        if not self.config.LOGGING_ENABLED:
+            return
+        levelno = LEVELS[level]
+        if self.logger.isEnabledFor(levelno):
+            self.logger.log(levelno, message, *args)
+
+    def start_run(self):
+        """Start the metrics window for a run; call before its data is loaded."""
+        self.instrumentation.start_run()
+
+    def span(self, stage):
+        """Context manager timing one occurrence of a pipeline stage."""
+        return self.instrumentation.span(stage)
+
+    def record(self, stage, seconds):
+        self.instrumentation.record(stage, seconds)
+
+    def add_rows(self, count):
+        self.instrumentation.add_rows(count)
+
+    def export_metrics(self, path=None):
+        """Log the per-stage summary, write it to METRICS_FILE (or path) and start a new window."""
+        path = path or getattr(self.config, 'METRICS_FILE', 'run_metrics.json')
+        summary = self.instrumentation.export(path)
+        stages = ', '.join(f"{stage} p50={stats['p50'] * 1000:.1f}ms p95={stats['p95'] * 1000:.1f}ms"
+                           for stage, stats in summary['stages'].items())
+        self.log('info', "Run metrics: %d rows in %.1fs (%.1f rows/s); %s; written to %s",
+                 summary['rows'], summary['elapsed'], summary['rows_per_sec'], stages, path)
+        return summary
+
+    def close(self):
+        _stop_listener()
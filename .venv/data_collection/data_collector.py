@@ -0,0 +1,78 @@
+import re
+import pandas as pd
+from openpyxl.utils.cell import range_boundaries
+from custom_logging.logger import Logger
+from data_collection.sheet_reader import SheetReader
+from data_collection.filter_compiler import FilterCompiler
+
+class DataCollector:
+    def __init__(self, logger, config):
+        self.logger = logger
+        self.config = config
+        self.active_filters = []
+
+    def get_active_filters(self, file_path, sheet_name):
+        """Read the autoFilter definitions of an Excel sheet and log details of each filtered column."""
+        try:
+            self.active_filters = SheetReader(file_path, sheet_name).read_filters()
+            self.log_active_filters()
+        except Exception as e:
+            self.logger.log('error', f"Error checking filters in Excel file: {e}")
+
+    def log_active_filters(self):
+        if not self.active_filters:
+            self.logger.log('info', 'No filters detected')
+        for col_letter, kind, spec in self.active_filters:
+            self.logger.log('info', f"Column {col_letter} has {kind} filter: {spec}")
+
+    def escape_special_chars(self, pattern):
+        """Escape special characters in the pattern for regex."""
+        return re.escape(pattern)
+
+    def apply_filters(self, df):
+        """Apply active filters to the DataFrame through a single combined boolean mask."""
+        self.logger.log('info', f"Applying filters to the DataFrame: {self.active_filters}")
+        if not self.active_filters:
+            return df
+        return df[FilterCompiler(self.logger).compile(df, self.active_filters)]
+
+    def collect_data(self):
+        """Collect data from the configured Excel file."""
+        file_path = self.config.LOCAL_EXCEL_FILE
+        sheet_name = self.config.EXCEL_SHEET_NAME
+        try:
+            # One streaming pass yields both the autoFilter definitions and the rows
+            with self.logger.span('data_load'):
+                self.active_filters, df = SheetReader(file_path, sheet_name, self.config.HEADER_ROW).read()
+            self.log_active_filters()
+            with self.logger.span('filter'):
+                df = self.apply_filters(df)  # Apply filters to the DataFrame
+            return df
+        except Exception as e:
+            self.logger.log('error', f"Error collecting data from local Excel file: {e}")
+            raise
+
+    def parse_excel_data(self, excel_data):
+        """Build a DataFrame from a Graph range response, using HEADER_ROW as the header."""
+        values = excel_data.get('values') or []
+        address = excel_data.get('address', 'A1').split('!')[-1]
+        first_row = range_boundaries(address)[1] or 1
+        header_offset = self.config.HEADER_ROW - first_row
+        if header_offset < 0 or header_offset >= len(values):
+            raise ValueError(f"Header row {self.config.HEADER_ROW} is outside the range {address}")
+        rows = values[header_offset + 1:]
+        columns = [[None if row[idx] == '' else row[idx] for row in rows]  # Graph returns empty cells as ''
+                   for idx in range(len(values[header_offset]))]
+        return self.frame_from_columns(values[header_offset], columns)
+
+    def frame_from_columns(self, header, columns):
+        """Assemble a DataFrame from per-column value lists, naming blank or duplicate headers like pandas."""
+        data = {}
+        for idx, (name, column) in enumerate(zip(header, columns)):
+            name = f"Unnamed: {idx}" if name in (None, '') else name
+            base, suffix = name, 1
+            while name in data:
+                name = f"{base}.{suffix}"
+                suffix += 1
+            data[name] = column
+        return pd.DataFrame(data)
@@ -0,0 +1,172 @@
+import re
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from openpyxl.utils import column_index_from_string
+from data_collection.sheet_reader import EXCEL_EPOCH
+
+COMPARISONS = {
+    'greaterThan': np.greater,
+    'greaterThanOrEqual': np.greater_equal,
+    'lessThan': np.less,
+    'lessThanOrEqual': np.less_equal,
+}
+
+
+def display_text(series):
+    """Cell values as Excel shows them in the filter list: integral numbers without a decimal point."""
+    def render(value):
+        if pd.isna(value):  # None, NaN and the NaT of blank date cells
+            return ''
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        if isinstance(value, bool):
+            return 'TRUE' if value else 'FALSE'
+        return str(value)
+    return series.map(render)
+
+
+def wildcard_regex(pattern):
+    """Translate an Excel filter pattern (*, ?, ~ escapes) into a regex."""
+    parts = []
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            parts.append(re.escape(ch))
+            escaped = False
+        elif ch == '~':
+            escaped = True
+        elif ch == '*':
+            parts.append('.*')
+        elif ch == '?':
+            parts.append('.')
+        else:
+            parts.append(re.escape(ch))
+    return ''.join(parts)
+
+
+def to_number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_numbers(series):
+    """Numeric view of a column for comparisons; dates become Excel serial numbers, as filters store them."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return (series - EXCEL_EPOCH) / timedelta(days=1)
+
+    def convert(value):
+        if isinstance(value, datetime):
+            return (value - EXCEL_EPOCH) / timedelta(days=1)
+        return value
+    return pd.to_numeric(series.map(convert), errors='coerce')
+
+
+class FilterCompiler:
+    """Compiles autoFilter definitions into a single boolean mask over a DataFrame."""
+
+    def __init__(self, logger):
+        self.logger = logger
+
+    def compile(self, df, filters):
+        mask = np.ones(len(df), dtype=bool)
+        for col_letter, kind, spec in filters:
+            col_idx = column_index_from_string(col_letter) - 1
+            if col_idx >= len(df.columns):
+                self.logger.log('warning', f"Filter on column {col_letter} is outside the data, skipping")
+                continue
+            series = df.iloc[:, col_idx]
+            handler = getattr(self, f"_mask_{kind}", None)
+            if handler is None:
+                self.logger.log('info', f"Skipping {kind} filter on column {df.columns[col_idx]}")
+                continue
+            column_mask = handler(series, spec)
+            if column_mask is not None:
+                mask &= np.asarray(column_mask, dtype=bool)
+        return mask
+
+    def _mask_values(self, series, spec):
+        text = display_text(series).str.casefold()
+        wanted = {value.casefold() for value in spec['values'] if value is not None}
+        mask = text.isin(wanted)
+        if spec['blank'] or not (wanted or spec['dates']):
+            mask |= text == ''
+        if spec['dates']:
+            mask |= self._mask_date_groups(series, spec['dates'])
+        return mask
+
+    def _mask_date_groups(self, series, groups):
+        dates = pd.to_datetime(series.where(series.map(lambda v: isinstance(v, datetime)), None), errors='coerce')
+        mask = pd.Series(False, index=series.index)
+        fields = ('year', 'month', 'day', 'hour', 'minute', 'second')
+        for group in groups:
+            depth = fields.index(group.get('dateTimeGrouping') or 'day') + 1
+            group_mask = dates.notna()
+            for field in fields[:depth]:
+                if group.get(field) is not None:
+                    group_mask &= getattr(dates.dt, field) == int(group[field])
+            mask |= group_mask
+        return mask
+
+    def _mask_custom(self, series, spec):
+        text = display_text(series)
+        masks = [self._mask_condition(series, text, operator, value) for operator, value in spec['conditions']]
+        if not masks:
+            return None
+        combined = masks[0]
+        for mask in masks[1:]:
+            combined = (combined & mask) if spec['and'] else (combined | mask)
+        return combined
+
+    def _mask_condition(self, series, text, operator, value):
+        if operator in ('equal', 'notEqual'):
+            if value.strip() == '':
+                mask = text.str.strip() == ''  # Excel writes " " for "(Blanks)" / "(NonBlanks)"
+            elif '*' in value or '?' in value:
+                mask = text.str.fullmatch(wildcard_regex(value), case=False)
+            else:
+                number = to_number(value)
+                numbers = to_numbers(series)
+                if number is not None and numbers.notna().any():
+                    mask = (numbers == number) | (text.str.casefold() == value.casefold())
+                else:
+                    mask = text.str.casefold() == value.casefold()
+            return ~mask if operator == 'notEqual' else mask
+
+        compare = COMPARISONS.get(operator)
+        if compare is None:
+            self.logger.log('warning', f"Unsupported custom filter operator {operator}, ignoring")
+            return pd.Series(True, index=series.index)
+        number = to_number(value)
+        if number is not None:
+            return compare(to_numbers(series), number)
+        non_blank = text != ''
+        return compare(text.str.casefold(), value.casefold()) & non_blank
+
+    def _mask_dynamic(self, series, spec):
+        numbers = to_numbers(series)
+        if spec == 'aboveAverage':
+            return numbers > numbers.mean()
+        if spec == 'belowAverage':
+            return numbers < numbers.mean()
+        self.logger.log('info', f"Skipping dynamic filter {spec} on column {series.name}")
+        return None
+
+    def _mask_top10(self, series, spec):
+        numbers = to_numbers(series)
+        valid = numbers.dropna()
+        if valid.empty:
+            return pd.Series(False, index=series.index)
+        count = spec['value']
+        if spec['percent']:
+            count = len(valid) * count / 100
+        count = max(int(count), 1)
+        if spec['top']:
+            return numbers >= valid.nlargest(count).iloc[-1]
+        return numbers <= valid.nsmallest(count).iloc[-1]
+
+    def _mask_color(self, series, spec):
+        self.logger.log('info', f"Skipping color filter on column {series.name}")
+        return None
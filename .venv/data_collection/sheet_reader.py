@@ -0,0 +1,202 @@
+import posixpath
+import re
+from datetime import datetime, timedelta
+from zipfile import ZipFile
+import pandas as pd
+from lxml import etree
+from openpyxl.utils import column_index_from_string, get_column_letter, range_boundaries
+
+NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+BUILTIN_DATE_FORMATS = set(range(14, 23)) | {45, 46, 47}
+EXCEL_EPOCH = datetime(1899, 12, 30)
+CELL_REF = re.compile(r'([A-Z]+)(\d+)')
+
+
+class SheetReader:
+    """Reads one worksheet of an .xlsx in a single streaming pass.
+
+    Shared strings, styles and the sheet XML are each iterparsed once; elements are cleared as soon as they
+    are consumed so memory stays proportional to the cell values kept, not to the XML tree.
+    """
+
+    def __init__(self, file_path, sheet_name, header_row=1):
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self.header_row = header_row
+
+    def read(self, include_rows=True):
+        """Return (filters, DataFrame); filters use the (column letter, kind, spec) layout of DataCollector."""
+        with ZipFile(self.file_path) as archive:
+            sheet_path = self._sheet_path(archive)
+            shared_strings = self._shared_strings(archive) if include_rows else []
+            date_styles = self._date_styles(archive) if include_rows else set()
+            with archive.open(sheet_path) as f:
+                return self._parse_sheet(f, shared_strings, date_styles, include_rows)
+
+    def read_filters(self):
+        return self.read(include_rows=False)[0]
+
+    def _sheet_path(self, archive):
+        workbook = etree.fromstring(archive.read('xl/workbook.xml'))
+        rel_id = None
+        for sheet in workbook.iter(f'{NS}sheet'):
+            if sheet.get('name') == self.sheet_name:
+                rel_id = sheet.get(f'{REL_NS}id')
+                break
+        if rel_id is None:
+            raise KeyError(f"Worksheet {self.sheet_name} does not exist.")
+        rels = etree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+        for rel in rels.iter(f'{PKG_REL_NS}Relationship'):
+            if rel.get('Id') == rel_id:
+                target = rel.get('Target')
+                return target.lstrip('/') if target.startswith('/') else posixpath.normpath(f'xl/{target}')
+        raise KeyError(f"No relationship found for worksheet {self.sheet_name}")
+
+    def _shared_strings(self, archive):
+        if 'xl/sharedStrings.xml' not in archive.namelist():
+            return []
+        strings = []
+        with archive.open('xl/sharedStrings.xml') as f:
+            for _, si in etree.iterparse(f, tag=f'{NS}si'):
+                # Rich text keeps its pieces in r/t; phonetic hints (rPh) are not part of the value.
+                strings.append(''.join(t.text or '' for t in si.iter(f'{NS}t')
+                                       if t.getparent().tag != f'{NS}rPh'))
+                si.clear()
+        return strings
+
+    def _date_styles(self, archive):
+        if 'xl/styles.xml' not in archive.namelist():
+            return set()
+        styles = etree.fromstring(archive.read('xl/styles.xml'))
+        date_formats = set(BUILTIN_DATE_FORMATS)
+        for num_fmt in styles.iter(f'{NS}numFmt'):
+            code = re.sub(r'"[^"]*"|\[[^\]]*\]|\\.', '', num_fmt.get('formatCode', '')).lower()
+            if any(ch in code for ch in 'dmyhs'):
+                date_formats.add(int(num_fmt.get('numFmtId')))
+        cell_xfs = styles.find(f'{NS}cellXfs')
+        if cell_xfs is None:
+            return set()
+        return {idx for idx, xf in enumerate(cell_xfs.iter(f'{NS}xf'))
+                if int(xf.get('numFmtId', 0)) in date_formats}
+
+    def _parse_sheet(self, f, shared_strings, date_styles, include_rows):
+        filters = []
+        header = None
+        columns = []
+        row_count = 0
+        last_row = 0
+        for _, elem in etree.iterparse(f, tag=(f'{NS}row', f'{NS}autoFilter')):
+            if elem.tag == f'{NS}autoFilter':
+                filters = self._parse_auto_filter(elem)
+                elem.clear()
+                continue
+            row_number = int(elem.get('r', last_row + 1))
+            last_row = row_number
+            if include_rows and row_number >= self.header_row:
+                values = self._parse_row(elem, shared_strings, date_styles)
+            else:
+                values = None
+            elem.clear()
+            while elem.getprevious() is not None:  # Drop already-consumed rows from the partial tree
+                del elem.getparent()[0]
+            if not values:
+                continue
+            if row_number == self.header_row:
+                header = values
+                continue
+            data_index = row_number - self.header_row - 1
+            for col_idx, value in values.items():
+                while len(columns) < col_idx:
+                    columns.append([None] * row_count)
+                column = columns[col_idx - 1]
+                column.extend([None] * (data_index - len(column)))
+                column.append(value)
+            row_count = data_index + 1
+
+        if not include_rows:
+            return filters, None
+        width = max(len(columns), max(header, default=0) if header else 0)
+        data = {}
+        for col_idx in range(1, width + 1):
+            column = columns[col_idx - 1] if col_idx <= len(columns) else []
+            column.extend([None] * (row_count - len(column)))
+            data[self._column_name(header or {}, col_idx, data)] = column
+        return filters, pd.DataFrame(data)
+
+    def _parse_row(self, row, shared_strings, date_styles):
+        values = {}
+        position = 0
+        for cell in row.iter(f'{NS}c'):
+            ref = cell.get('r')
+            position = column_index_from_string(CELL_REF.match(ref).group(1)) if ref else position + 1
+            cell_type = cell.get('t', 'n')
+            if cell_type == 'inlineStr':
+                values[position] = ''.join(t.text or '' for t in cell.iter(f'{NS}t'))
+                continue
+            v = cell.find(f'{NS}v')
+            if v is None or v.text is None:
+                continue
+            text = v.text
+            if cell_type == 's':
+                values[position] = shared_strings[int(text)]
+            elif cell_type == 'str':
+                values[position] = text
+            elif cell_type == 'd':
+                values[position] = datetime.fromisoformat(text)
+            elif cell_type == 'b':
+                values[position] = text == '1'
+            elif cell_type == 'e':
+                continue  # Error values (#N/A, #REF!) read as empty, as pandas does
+            else:
+                number = float(text)
+                if int(cell.get('s', 0)) in date_styles:
+                    values[position] = EXCEL_EPOCH + timedelta(days=number)
+                else:
+                    values[position] = int(number) if number.is_integer() else number
+        return values
+
+    def _column_name(self, header, col_idx, existing):
+        name = header.get(col_idx)
+        name = f"Unnamed: {col_idx - 1}" if name is None else name
+        base, suffix = name, 1
+        while name in existing:  # pandas-style mangling of duplicate headers
+            name = f"{base}.{suffix}"
+            suffix += 1
+        return name
+
+    def _parse_auto_filter(self, auto_filter):
+        filters = []
+        first_col = range_boundaries(auto_filter.get('ref'))[0]  # colId counts from the ref's first column
+        for filter_col in auto_filter.iter(f'{NS}filterColumn'):
+            col_letter = get_column_letter(first_col + int(filter_col.get('colId')))
+            values = filter_col.find(f'{NS}filters')
+            if values is not None:
+                filters.append((col_letter, 'values', {
+                    'values': [f.get('val') for f in values.iter(f'{NS}filter')],
+                    'blank': values.get('blank') in ('1', 'true'),
+                    'dates': [{key: dg.get(key) for key in ('year', 'month', 'day', 'dateTimeGrouping')}
+                              for dg in values.iter(f'{NS}dateGroupItem')],
+                }))
+            custom = filter_col.find(f'{NS}customFilters')
+            if custom is not None:
+                filters.append((col_letter, 'custom', {
+                    'and': custom.get('and') in ('1', 'true'),
+                    'conditions': [(cf.get('operator', 'equal'), cf.get('val', ''))
+                                   for cf in custom.iter(f'{NS}customFilter')],
+                }))
+            dynamic = filter_col.find(f'{NS}dynamicFilter')
+            if dynamic is not None:
+                filters.append((col_letter, 'dynamic', dynamic.get('type')))
+            top10 = filter_col.find(f'{NS}top10')
+            if top10 is not None:
+                filters.append((col_letter, 'top10', {
+                    'top': top10.get('top', '1') in ('1', 'true'),
+                    'percent': top10.get('percent', '0') in ('1', 'true'),
+                    'value': float(top10.get('val', 10)),
+                }))
+            if filter_col.find(f'{NS}colorFilter') is not None:
+                filters.append((col_letter, 'color', None))
+        return filters
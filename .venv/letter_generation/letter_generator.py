@@ -0,0 +1,159 @@
+import os
+from datetime import datetime
+from docx import Document
+from openai import OpenAI
+from template_management.template_manager import TemplateManager
+from custom_logging.logger import Logger
+from template_management import compiled_template
+from letter_generation.text_normalizer import TextNormalizer, NAME, ADDRESS
+from letter_generation.pipeline import LetterPipeline
+
+client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+
+class LetterGenerator:
+    def __init__(self, config, logger, printer, template_manager):
+        self.config = config
+        self.logger = logger
+        self.printer = printer
+        self.template_manager = template_manager
+        self.normalizer = TextNormalizer(config, logger, client)
+
+    def clean_name(self, text):
+        if not text:
+            return "Resident"
+        try:
+            name = self.normalizer.normalize(NAME, text)
+            return name if name else "Resident"
+        except Exception as e:
+            self.logger.log('error', f"Error extracting name: {e}")
+            return "Resident"
+
+    def format_address(self, text):
+        if not text:
+            return "Address not available"
+        try:
+            formatted_address = self.normalizer.normalize(ADDRESS, text)
+            return formatted_address if formatted_address else text
+        except Exception as e:
+            self.logger.log('error', f"Error formatting address: {e}")
+            return text
+
+    def sanitize_filename(self, wo, address):
+        """Generate a valid filename using the work order number and a shortened address."""
+        short_address = address[:20].replace('/', '').replace('\\', '').replace(':', '').replace('*', '').replace('?',
+                                                                                                                  '').replace(
+            '"', '').replace('<', '').replace('>', '').replace('|', '')
+        filename = f"{wo}_{short_address}".replace(' ', '_')
+        valid_filename = "".join(c for c in filename if c.isalnum() or c in "_-")
+        valid_filename = valid_filename[:255]  # Limit the filename length if necessary
+        return f"{valid_filename}.docx"
+
+    def placeholder_values(self, data):
+        values = {}
+        with self.logger.span('llm'):
+            for placeholder, column in self.config.PLACEHOLDERS.items():
+                value = str(self.get_value_for_placeholder(column, data))
+                self.logger.log('debug', 'Replacing placeholder %s with %s', placeholder, value)
+                values[placeholder] = value
+        return values
+
+    def replace_placeholders(self, document, data):
+        compiled_template.replace_in_document(document, self.placeholder_values(data))
+        return document
+
+    def render_letter(self, template_name, data):
+        """Render a letter from the compiled template cache in a single substitution pass."""
+        template = self.template_manager.get_compiled_template(template_name)
+        values = self.placeholder_values(data)
+        with self.logger.span('render'):
+            return template.render(values)
+
+    def get_value_for_placeholder(self, column, data):
+        if column == self.config.NAME_COLUMN:
+            return self.clean_name(data[column])
+        elif column == self.config.ADDRESS_COLUMN:
+            return self.format_address(data[column])
+        elif column == 'Date':
+            return datetime.now().strftime("%d %B %Y")
+        elif column == self.config.WORK_ORDER_COLUMN:
+            return data[column]
+        else:
+            return str(data[column])
+
+    def replace_in_document(self, document, placeholder, value):
+        compiled_template.replace_in_document(document, {placeholder: value})
+
+    def generate_and_print_letters(self, data_list, workers=None):
+        """Generate, print and record a letter for every row; workers > 1 runs the staged pipeline.
+
+        Returns the positions in data_list of the rows that failed.
+        """
+        workers = workers or getattr(self.config, 'PIPELINE_WORKERS', 1)
+        try:
+            self.template_manager.open_write_back_session()
+        except Exception as e:
+            self.logger.log('warning', f"Could not open Excel write-back session, saving after every letter: {e}")
+        self.normalizer.start_run()  # Cache statistics cover this run only, not earlier watch ticks
+        try:
+            self.normalizer.pre_resolve(data_list)
+        except Exception as e:
+            self.logger.log('warning', f"Could not pre-resolve names and addresses, resolving per letter: {e}")
+        try:
+            if workers > 1:
+                failed = sorted({failure['row'] for failure in LetterPipeline(self, workers).run(data_list)})
+            else:
+                failed = self._generate_and_print_letters(data_list)
+        finally:
+            self.report_print_jobs(self.printer.flush())
+            self.normalizer.log_stats()
+            self.template_manager.close_write_back_session()  # Flush queued Excel updates even on failure
+            self.logger.add_rows(len(data_list))
+            self.logger.export_metrics()
+        return failed
+
+    def report_print_jobs(self, jobs):
+        """Log completion status and latency of the print jobs finished during this run."""
+        if not jobs:
+            return
+        failed = [job for job in jobs if job.status != 'printed']
+        latencies = sorted(job.latency for job in jobs if job.latency is not None)
+        median = latencies[len(latencies) // 2] if latencies else 0.0
+        self.logger.log('info', f"Print jobs: {len(jobs) - len(failed)} printed, {len(failed)} failed, "
+                                f"median latency {median:.2f}s, max {latencies[-1] if latencies else 0.0:.2f}s")
+        for job in failed:
+            self.logger.log('error', f"Print job failed for {job.file_name}: {job.error}")
+
+    def _generate_and_print_letters(self, data_list):
+        failed = []
+        for row, data in enumerate(data_list):
+            try:
+                wo = data[self.config.PLACEHOLDERS['WO']]
+                address = data[self.config.PLACEHOLDERS['ADDRESS_PLACEHOLDER']]
+                sanitized_name = self.sanitize_filename(wo, address)
+                file_path = os.path.join(self.config.PRINT_SERVER_DIR, sanitized_name)
+
+                self.logger.log('debug', 'Work order %s, address %s -> %s', wo, address, file_path)
+                template_name = self.template_manager.determine_next_letter(data)
+                if template_name:
+                    self.logger.log('info', 'Using template %s for %s', template_name, wo)
+                    personalized_document = self.render_letter(template_name, data)
+                    with self.logger.span('save'):
+                        personalized_document.save(file_path)
+                    if os.path.exists(file_path):
+                        self.logger.log('info', 'Document saved successfully: %s', file_path)
+                        try:
+                            self.printer.print_letter(sanitized_name)  # Pass only the file name to the print spooler
+                            self.logger.log('debug', 'Queued letter for printing for %s', data[self.config.NAME_COLUMN])
+                        except Exception as e:
+                            self.logger.log('error', f'Error printing document {file_path}: {e}')
+                    else:
+                        self.logger.log('error', f'Failed to save document: {file_path}')
+                    self.template_manager.update_excel(data, template_name)
+                else:
+                    self.logger.log('info', 'Skipping %s, all letters have been sent.', data[self.config.NAME_COLUMN])
+            except Exception as e:
+                self.logger.log('error',
+                                f"Error generating and printing letters for {data.get(self.config.NAME_COLUMN, 'Unknown')}: {e}")
+                failed.append(row)
+        return failed
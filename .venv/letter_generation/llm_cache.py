@@ -0,0 +1,55 @@
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+class LLMResponseCache:
+    """Two-level cache for LLM normalisation results: an in-memory LRU in front of a SQLite file."""
+
+    def __init__(self, db_path, max_memory_entries=4096):
+        self.db_path = db_path
+        self.max_memory_entries = max_memory_entries
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, kind TEXT, model TEXT, value TEXT)"
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def make_key(kind, model, text):
+        return hashlib.sha256(f"{kind}\0{model}\0{text}".encode('utf-8')).hexdigest()
+
+    def get(self, kind, model, text):
+        key = self.make_key(kind, model, text)
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+            row = self.connection.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, kind, model, text, value):
+        key = self.make_key(kind, model, text)
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (key, kind, model, value) VALUES (?, ?, ?, ?)",
+                (key, kind, model, value)
+            )
+            self.connection.commit()
+            self._remember(key, value)
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
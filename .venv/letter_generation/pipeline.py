@@ -0,0 +1,219 @@
+import csv
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from template_management.compiled_template import TemplateCache
+
+_STOP = object()
+_worker_templates = None
+
+
+class _SilentLogger:
+    def log(self, level, message, *args):
+        pass
+
+
+def _init_render_worker(templates_dir):
+    global _worker_templates
+    _worker_templates = TemplateCache(templates_dir, _SilentLogger())
+
+
+def render_letter_file(template_name, values, file_path):
+    """Process-pool entry point: render and save to file_path, returning (saved, render_seconds, save_seconds)."""
+    start = time.perf_counter()
+    document = _worker_templates.get(template_name).render(values)
+    rendered = time.perf_counter()
+    document.save(file_path)
+    return os.path.exists(file_path), rendered - start, time.perf_counter() - rendered
+
+
+class LetterJob:
+    def __init__(self, seq, row, data, template_name, file_name, file_path):
+        self.seq = seq
+        self.row = row
+        self.data = data
+        self.template_name = template_name
+        self.file_name = file_name
+        self.file_path = file_path
+        self.saved = False
+        self.stage = None
+        self.error = None
+
+
+class LetterPipeline:
+    """Staged, bounded execution of generate_and_print_letters.
+
+    Placeholder resolution runs in a thread pool, rendering and saving in a process pool, and printing and
+    Excel bookkeeping each in one consumer thread that sees letters in input order, so the files written and
+    the spreadsheet updates match the serial path.
+    """
+
+    def __init__(self, letter_generator, workers, max_in_flight=None):
+        self.generator = letter_generator
+        self.config = letter_generator.config
+        self.logger = letter_generator.logger
+        self.workers = workers
+        self.max_in_flight = max_in_flight or getattr(self.config, 'PIPELINE_MAX_IN_FLIGHT', workers * 4)
+        self.failed_rows = []
+        self.failed_lock = threading.Lock()
+
+    def run(self, data_list):
+        in_flight = threading.BoundedSemaphore(self.max_in_flight)
+        busy_paths = set()
+        paths_changed = threading.Condition()
+        completed = queue.Queue()
+        print_queue = queue.Queue(maxsize=self.max_in_flight)
+        excel_queue = queue.Queue(maxsize=self.max_in_flight)
+
+        def finish(job):
+            with paths_changed:
+                busy_paths.discard(job.file_path)
+                paths_changed.notify_all()
+            in_flight.release()
+
+        threads = [
+            threading.Thread(target=self._reorder, args=(completed, print_queue), daemon=True),
+            threading.Thread(target=self._print_stage, args=(print_queue, excel_queue), daemon=True),
+            threading.Thread(target=self._excel_stage, args=(excel_queue, finish), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        seq = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as llm_pool, \
+                ProcessPoolExecutor(max_workers=self.workers, initializer=_init_render_worker,
+                                    initargs=(self.config.TEMPLATES_DIR,)) as render_pool:
+            for row, data in enumerate(data_list):
+                job = self._plan(row, data, seq)
+                if job is None:
+                    continue
+                in_flight.acquire()  # Backpressure: stop reading rows while the pipeline is full
+                with paths_changed:
+                    # Two rows writing the same file must not render concurrently; serial order wins.
+                    while job.file_path in busy_paths:
+                        paths_changed.wait()
+                    busy_paths.add(job.file_path)
+                seq += 1
+                self._submit(job, llm_pool, render_pool, completed)
+            completed.put((seq, _STOP))
+            for thread in threads:
+                thread.join()
+
+        self._write_failed_rows_report()
+        return self.failed_rows
+
+    def _plan(self, row, data, seq):
+        try:
+            wo = data[self.config.PLACEHOLDERS['WO']]
+            address = data[self.config.PLACEHOLDERS['ADDRESS_PLACEHOLDER']]
+            file_name = self.generator.sanitize_filename(wo, address)
+            template_name = self.generator.template_manager.determine_next_letter(data)
+        except Exception as e:
+            self._record_failure(LetterJob(seq, row, data, None, None, None), 'plan', e)
+            return None
+        if not template_name:
+            self.logger.log('info', 'Skipping %s, all letters have been sent.', data[self.config.NAME_COLUMN])
+            return None
+        return LetterJob(seq, row, data, template_name, file_name,
+                         os.path.join(self.config.PRINT_SERVER_DIR, file_name))
+
+    def _submit(self, job, llm_pool, render_pool, completed):
+        def on_rendered(future):
+            try:
+                job.saved, render_seconds, save_seconds = future.result()
+                self.logger.record('render', render_seconds)
+                self.logger.record('save', save_seconds)
+                if not job.saved:
+                    self.logger.log('error', f'Failed to save document: {job.file_path}')
+            except Exception as e:
+                self._record_failure(job, 'render', e)
+            completed.put((job.seq, job))
+
+        def on_resolved(future):
+            try:
+                values = future.result()
+            except Exception as e:
+                self._record_failure(job, 'llm', e)
+                completed.put((job.seq, job))
+                return
+            try:
+                render_pool.submit(render_letter_file, job.template_name, values,
+                                   job.file_path).add_done_callback(on_rendered)
+            except Exception as e:
+                self._record_failure(job, 'render', e)
+                completed.put((job.seq, job))
+
+        llm_pool.submit(self.generator.placeholder_values, job.data).add_done_callback(on_resolved)
+
+    def _reorder(self, completed, print_queue):
+        """Release finished jobs to the ordered consumers strictly in input order."""
+        pending = {}
+        next_seq = 0
+        total = None
+        while total is None or next_seq < total:
+            seq, job = completed.get()
+            if job is _STOP:
+                total = seq
+                continue
+            pending[seq] = job
+            while next_seq in pending:
+                print_queue.put(pending.pop(next_seq))
+                next_seq += 1
+        print_queue.put(_STOP)
+
+    def _print_stage(self, print_queue, excel_queue):
+        while True:
+            job = print_queue.get()
+            if job is not _STOP and job.saved:
+                self.logger.log('info', 'Document saved successfully: %s', job.file_path)
+                try:
+                    self.generator.printer.print_letter(job.file_name)
+                    self.logger.log('debug', 'Queued letter for printing for %s', job.data[self.config.NAME_COLUMN])
+                except Exception as e:
+                    self.logger.log('error', f'Error printing document {job.file_path}: {e}')
+            excel_queue.put(job)
+            if job is _STOP:
+                return
+
+    def _excel_stage(self, excel_queue, finish):
+        while True:
+            job = excel_queue.get()
+            if job is _STOP:
+                return
+            try:
+                if job.error is None:
+                    self.generator.template_manager.update_excel(job.data, job.template_name)
+            except Exception as e:
+                self._record_failure(job, 'excel', e)
+            finally:
+                finish(job)
+
+    def _record_failure(self, job, stage, error):
+        job.stage = stage
+        job.error = error
+        name = job.data.get(self.config.NAME_COLUMN, 'Unknown') if hasattr(job.data, 'get') else 'Unknown'
+        self.logger.log('error', f"Error generating and printing letters for {name} ({stage}): {error}")
+        with self.failed_lock:
+            self.failed_rows.append({
+                'row': job.row,
+                'work_order': job.data.get(self.config.WORK_ORDER_COLUMN, '') if hasattr(job.data, 'get') else '',
+                'stage': stage,
+                'error': str(error),
+            })
+
+    def _write_failed_rows_report(self):
+        if not self.failed_rows:
+            return
+        report_path = os.path.join(self.config.PRINT_SERVER_DIR,
+                                   getattr(self.config, 'FAILED_ROWS_REPORT', 'failed_rows.csv'))
+        self.failed_rows.sort(key=lambda failure: failure['row'])
+        try:
+            with open(report_path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=['row', 'work_order', 'stage', 'error'])
+                writer.writeheader()
+                writer.writerows(self.failed_rows)
+            self.logger.log('warning', f"{len(self.failed_rows)} row(s) failed, see {report_path}")
+        except OSError as e:
+            self.logger.log('error', f"Could not write failed rows report {report_path}: {e}")
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+import pandas as pd
+from openai import AsyncOpenAI
+from letter_generation.llm_cache import LLMResponseCache
+
+NAME = 'name'
+ADDRESS = 'address'
+
+PROMPTS = {
+    NAME: ("Extract the name including the person's title from the following text. Only provide the name, "
+           "no additional text. If there is no obvious name, return 'Resident': '{text}'", 50),
+    ADDRESS: ("Format the following address for a letter with proper line breaks, fill in missing parts if you "
+              "know the address. Only provide the formatted address, no additional text: '{text}'", 150),
+}
+
+
+class TextNormalizer:
+    """Resolves names and addresses through the LLM, backed by a persistent cache and concurrent prefetching."""
+
+    def __init__(self, config, logger, client, cache=None):
+        self.config = config
+        self.logger = logger
+        self.client = client
+        self.model = getattr(config, 'OPENAI_MODEL', 'gpt-4o')
+        self.concurrency = getattr(config, 'LLM_CONCURRENCY', 8)
+        self.requests_per_second = getattr(config, 'LLM_REQUESTS_PER_SECOND', 5)
+        self.cache = cache or LLMResponseCache(getattr(config, 'LLM_CACHE_PATH', 'llm_cache.sqlite'),
+                                               getattr(config, 'LLM_MEMORY_CACHE_SIZE', 4096))
+        self.stats_lock = threading.Lock()  # Pipeline workers call normalize concurrently
+        self.start_run()
+
+    def start_run(self):
+        """Reset the cache statistics; call at the start of each run so stats() covers that run only."""
+        with self.stats_lock:
+            self.hits = 0  # Served from entries that existed before this run
+            self.reused = 0  # Served from entries fetched earlier in this run
+            self.misses = 0
+            self.fetched = set()
+            self.prefetched = set()
+            self.api_calls = 0
+            self.api_seconds = 0.0
+
+    def build_messages(self, kind, text):
+        prompt, max_tokens = PROMPTS[kind]
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": prompt.format(text=text)}
+        ]
+        return messages, max_tokens
+
+    def lookup(self, kind, text):
+        key = (kind, str(text))
+        value = self.cache.get(kind, self.model, key[1])
+        with self.stats_lock:
+            if key in self.prefetched:
+                return value  # Already counted when pre_resolve looked it up
+            if value is None:
+                self.misses += 1
+            elif key in self.fetched:
+                self.reused += 1
+            else:
+                self.hits += 1
+        return value
+
+    def store(self, kind, text, value):
+        self.cache.put(kind, self.model, str(text), value)
+        with self.stats_lock:
+            self.fetched.add((kind, str(text)))
+
+    def normalize(self, kind, text):
+        """Return the cached result for text, calling the LLM on a miss. Errors propagate to the caller."""
+        value = self.lookup(kind, text)
+        if value is not None:
+            return value
+        messages, max_tokens = self.build_messages(kind, text)
+        start = time.perf_counter()
+        response = self.client.chat.completions.create(model=self.model, messages=messages, max_tokens=max_tokens)
+        self.record_call(time.perf_counter() - start)
+        value = response.choices[0].message.content.strip()
+        if value:
+            self.store(kind, text, value)
+        return value
+
+    def record_call(self, elapsed):
+        with self.stats_lock:
+            self.api_calls += 1
+            self.api_seconds += elapsed
+
+    def pre_resolve(self, data_list):
+        """Resolve every unique name and address in data_list concurrently before any letter is rendered."""
+        pending = []
+        seen = set()
+        for data in data_list:
+            for kind, column in ((NAME, self.config.NAME_COLUMN), (ADDRESS, self.config.ADDRESS_COLUMN)):
+                text = data.get(column)
+                if pd.isna(text) or not text or (kind, text) in seen:
+                    continue
+                seen.add((kind, text))
+                value = self.lookup(kind, text)
+                with self.stats_lock:
+                    self.prefetched.add((kind, str(text)))
+                if value is None:
+                    pending.append((kind, text))
+        self.logger.log('info', f"Pre-resolving {len(pending)} of {len(seen)} unique names/addresses via LLM")
+        if pending:
+            with self.logger.span('llm_prefetch'):  # One batch; per-letter lookups are timed as 'llm'
+                asyncio.run(self._resolve_all(pending))
+
+    async def _resolve_all(self, pending):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        interval = 1.0 / self.requests_per_second if self.requests_per_second else 0.0
+        schedule = {'next': time.monotonic()}
+        schedule_lock = asyncio.Lock()
+
+        async def wait_for_slot():
+            async with schedule_lock:
+                now = time.monotonic()
+                delay = schedule['next'] - now
+                schedule['next'] = max(now, schedule['next']) + interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        async def resolve(async_client, kind, text):
+            async with semaphore:
+                await wait_for_slot()
+                messages, max_tokens = self.build_messages(kind, text)
+                start = time.perf_counter()
+                try:
+                    response = await async_client.chat.completions.create(
+                        model=self.model, messages=messages, max_tokens=max_tokens)
+                except Exception as e:
+                    self.logger.log('error', f"Error pre-resolving {kind} '{text}': {e}")
+                    return
+                self.record_call(time.perf_counter() - start)
+                value = response.choices[0].message.content.strip()
+                if value:
+                    self.store(kind, text, value)
+
+        async with AsyncOpenAI(api_key=self.client.api_key, base_url=self.client.base_url) as async_client:
+            await asyncio.gather(*(resolve(async_client, kind, text) for kind, text in pending))
+
+    def stats(self):
+        """Cache statistics for this run; names and addresses pre-resolved up front are counted once each."""
+        with self.stats_lock:
+            lookups = self.hits + self.reused + self.misses
+            average_call = self.api_seconds / self.api_calls if self.api_calls else 0.0
+            return {
+                'hits': self.hits,
+                'reused': self.reused,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'api_calls': self.api_calls,
+                'api_seconds': self.api_seconds,
+                'estimated_seconds_saved': self.hits * average_call,
+            }
+
+    def log_stats(self):
+        stats = self.stats()
+        self.logger.log('info', f"LLM cache hit rate {stats['hit_rate']:.1%} ({stats['hits']} hits, "
+                                f"{stats['reused']} reused from this run, {stats['misses']} misses), "
+                                f"{stats['api_calls']} API calls in {stats['api_seconds']:.1f}s, "
+                                f"~{stats['estimated_seconds_saved']:.1f}s saved")
@@ -0,0 +1,67 @@
+import argparse
+import logging
+from gui.gui import run_gui
+from config.settings import load_defaults
+from custom_logging.logger import Logger
+from data_collection.data_collector import DataCollector
+from printing.printer import Printer
+from template_management.template_manager import TemplateManager
+from letter_generation.letter_generator import LetterGenerator
+from watcher.teams_excel_watcher import TeamsExcelWatcher
+
+def main():
+    parser = argparse.ArgumentParser(description="Letter Automation System")
+    parser.add_argument('--verbose', action='store_true', help="Enable verbose logging")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and process new or changed rows every WATCHER_INTERVAL seconds")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Run letter generation as a parallel pipeline with this many workers")
+    args = parser.parse_args()
+
+    # Load configurations
+    config = load_defaults()
+
+    # Initialize Logger
+    logger = Logger(config, log_level=logging.DEBUG if args.verbose else logging.INFO)
+
+    # Disable logging if configured
+    if not config.LOGGING_ENABLED:
+        logger.logger.disabled = True
+
+    # Check if the application should run with GUI
+    if config.USE_GUI:
+        run_gui(config)
+    else:
+        # Initialize necessary components for processing
+        data_collector = DataCollector(logger, config)
+        printer = Printer.from_config(config, logger)
+        template_manager = TemplateManager(config, logger)
+        letter_generator = LetterGenerator(config, logger, printer, template_manager)
+
+        # Handling for Microsoft Teams Excel integration or local Excel files
+        if args.watch or config.USE_TEAMS_EXCEL:
+            watcher = TeamsExcelWatcher(data_collector, logger, config.TENANT_ID, config.CLIENT_ID,
+                                        config.CLIENT_SECRET, config.EXCEL_FILE_ID, config.EXCEL_FILE_DRIVE,
+                                        config=config, letter_generator=letter_generator)
+        if args.watch:
+            try:
+                watcher.watch_for_changes()
+            finally:
+                printer.close()
+            return
+        logger.start_run()
+        if config.USE_TEAMS_EXCEL:
+            df = watcher.get_excel_dataframe()
+        else:
+            df = data_collector.collect_data()
+
+        # Generate and print letters without filtering
+        try:
+            letter_generator.generate_and_print_letters(df.to_dict(orient='records'), workers=args.workers)
+        except Exception as e:
+            logger.log('error', f"Error during data processing: {e}")
+        finally:
+            printer.close()
+
+if __name__ == "__main__":
+    main()
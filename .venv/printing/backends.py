@@ -0,0 +1,136 @@
+import os
+import shutil
+from datetime import datetime
+
+WD_SECTION_BREAK_NEXT_PAGE = 2
+WD_COLLAPSE_END = 0
+
+
+class PrintBackend:
+    """Interface for the spooler's print backends.
+
+    print_batch receives absolute paths and returns a dict of path -> exception for files that failed;
+    raising marks the whole batch as failed.
+    """
+
+    def start(self):
+        pass
+
+    def print_batch(self, paths):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class WordSessionBackend(PrintBackend):
+    """Prints each document through a single Word instance kept alive until close()."""
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.word = None
+
+    def start(self):
+        import pythoncom
+        pythoncom.CoInitialize()  # COM must be initialised on the spooler thread
+
+    def ensure_word(self):
+        if self.word is None:
+            import win32com.client as win32
+            self.logger.log('info', 'Starting Word print session')
+            self.word = win32.gencache.EnsureDispatch('Word.Application')
+            self.word.Visible = False
+        return self.word
+
+    def print_batch(self, paths):
+        failures = {}
+        for path in paths:
+            try:
+                doc = self.ensure_word().Documents.Open(path)
+                self.logger.log('info', 'Printing document: %s', path)
+                doc.PrintOut()
+                doc.Close(False)
+            except Exception as e:
+                failures[path] = e
+                self.reset_if_dead()
+        return failures
+
+    def reset_if_dead(self):
+        try:
+            self.word.Documents.Count
+        except Exception:
+            self.logger.log('warning', 'Word session lost, a new one will be started')
+            self.word = None
+
+    def close(self):
+        if self.word is not None:
+            try:
+                self.word.Quit()
+            except Exception as e:
+                self.logger.log('warning', f'Error closing Word session: {e}')
+            self.word = None
+
+
+class CombinedWordBackend(WordSessionBackend):
+    """Merges the batch into one Word document, one letter per section, and prints it as a single job."""
+
+    def print_batch(self, paths):
+        word = self.ensure_word()
+        combined = word.Documents.Add()
+        try:
+            for idx, path in enumerate(paths):
+                target = combined.Content
+                target.Collapse(WD_COLLAPSE_END)
+                if idx:
+                    target.InsertBreak(WD_SECTION_BREAK_NEXT_PAGE)
+                    target = combined.Content
+                    target.Collapse(WD_COLLAPSE_END)
+                target.InsertFile(path)
+            self.logger.log('info', f'Printing combined job of {len(paths)} letter(s)')
+            combined.PrintOut()
+        except Exception:
+            self.reset_if_dead()
+            raise
+        finally:
+            if self.word is not None:
+                combined.Close(False)
+        return {}
+
+
+class SpoolDirectoryBackend(PrintBackend):
+    """Copies each batch into a spool directory with a manifest, for print servers that watch a folder."""
+
+    def __init__(self, spool_dir, logger):
+        self.spool_dir = spool_dir
+        self.logger = logger
+        self.batches = 0
+
+    def start(self):
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+    def print_batch(self, paths):
+        failures = {}
+        spooled = []
+        for path in paths:
+            try:
+                shutil.copy2(path, self.spool_dir)
+                spooled.append(os.path.basename(path))
+            except OSError as e:
+                failures[path] = e
+        self.batches += 1
+        manifest = os.path.join(self.spool_dir, f"batch_{datetime.now().strftime('%Y%m%d%H%M%S')}_{self.batches}.txt")
+        with open(manifest, 'w') as f:
+            f.write('\n'.join(spooled))
+        self.logger.log('info', f'Spooled {len(spooled)} letter(s) to {self.spool_dir}')
+        return failures
+
+
+def create_backend(config, logger):
+    backend = getattr(config, 'PRINT_BACKEND', 'word')
+    if backend == 'word':
+        return WordSessionBackend(logger)
+    if backend == 'word_combined':
+        return CombinedWordBackend(logger)
+    if backend == 'spool':
+        return SpoolDirectoryBackend(getattr(config, 'PRINT_SPOOL_DIR', 'print_spool'), logger)
+    raise ValueError(f"Unknown PRINT_BACKEND: {backend}")
@@ -0,0 +1,138 @@
+import os
+import queue
+import threading
+import time
+from custom_logging.logger import Logger
+from printing.backends import WordSessionBackend, create_backend
+
+
+class PrintJob:
+    def __init__(self, file_name, full_path):
+        self.file_name = file_name
+        self.full_path = full_path
+        self.status = 'queued'
+        self.error = None
+        self.submitted = time.monotonic()
+        self.completed = None
+
+    @property
+    def latency(self):
+        return None if self.completed is None else self.completed - self.submitted
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class Printer:
+    """Print spooler: letters are queued and handed to the backend in batches on a background thread.
+
+    A batch is sent once batch_size letters are waiting, flush_interval seconds after its first letter,
+    or when flush() is called.
+    """
+
+    def __init__(self, print_server_dir, logger, backend=None, batch_size=1, flush_interval=2.0):
+        self.print_server_dir = print_server_dir
+        self.logger = logger
+        self.backend = backend or WordSessionBackend(logger)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.finished = []
+        self.finished_lock = threading.Lock()
+        self.thread = None
+
+    @classmethod
+    def from_config(cls, config, logger):
+        return cls(config.PRINT_SERVER_DIR, logger, backend=create_backend(config, logger),
+                   batch_size=getattr(config, 'PRINT_BATCH_SIZE', 1),
+                   flush_interval=getattr(config, 'PRINT_FLUSH_INTERVAL', 2.0))
+
+    def print_letter(self, file_name):
+        """Queue a letter for printing and return its PrintJob; raises if the file does not exist."""
+        full_path = os.path.abspath(os.path.join(self.print_server_dir, file_name))
+        self.logger.log('debug', 'Full file path for printing: %s', full_path)
+
+        if not os.path.exists(full_path):
+            self.logger.log('error', f'File not found: {full_path}')
+            raise FileNotFoundError(f'File not found: {full_path}')
+
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, name='print-spooler', daemon=True)
+            self.thread.start()
+        job = PrintJob(file_name, full_path)
+        self.queue.put(job)
+        return job
+
+    def flush(self):
+        """Print everything queued so far and return the jobs finished since the previous flush."""
+        if self.thread is not None and self.thread.is_alive():
+            request = _FlushRequest()
+            self.queue.put(request)
+            request.done.wait()
+        with self.finished_lock:
+            finished, self.finished = self.finished, []
+        return finished
+
+    def close(self):
+        finished = self.flush()
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        self.thread = None
+        return finished
+
+    def _run(self):
+        try:
+            self.backend.start()
+        except Exception as e:
+            self.logger.log('error', f'Error starting print backend: {e}')
+        batch = []
+        deadline = None
+        try:
+            while True:
+                if deadline is not None and time.monotonic() >= deadline:
+                    # Flush interval elapsed; send before taking more jobs so a steady stream cannot delay it
+                    self._print_batch(batch)
+                    batch, deadline = [], None
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    continue
+                if isinstance(item, PrintJob):
+                    batch.append(item)
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                    if len(batch) < self.batch_size:
+                        continue
+                if batch:
+                    self._print_batch(batch)
+                    batch, deadline = [], None
+                if isinstance(item, _FlushRequest):
+                    item.done.set()
+                elif item is None:
+                    return
+        finally:
+            self.backend.close()
+
+    def _print_batch(self, batch):
+        paths = [job.full_path for job in batch]
+        try:
+            failures = self.backend.print_batch(paths)
+        except Exception as e:
+            failures = {path: e for path in paths}
+        now = time.monotonic()
+        for job in batch:
+            job.completed = now
+            job.error = failures.get(job.full_path)
+            self.logger.record('print', job.latency)
+            if job.error is None:
+                job.status = 'printed'
+                self.logger.log('info', 'Successfully printed: %s (%.2fs)', job.full_path, job.latency)
+            else:
+                job.status = 'failed'
+                self.logger.log('error', f'Error printing document {job.full_path}: {job.error}')
+        with self.finished_lock:
+            self.finished.extend(batch)
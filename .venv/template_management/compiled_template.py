@@ -0,0 +1,133 @@
+import io
+import os
+import re
+from docx import Document
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+
+def iter_paragraphs(document):
+    """Yield body paragraphs followed by table cell paragraphs (including nested tables) in a stable order."""
+    yield from document.paragraphs
+    tables = list(document.tables)
+    while tables:
+        table = tables.pop(0)
+        for row in table.rows:
+            for cell in row.cells:
+                yield from cell.paragraphs
+                tables.extend(cell.tables)
+
+
+def replace_in_paragraph(paragraph, replacements):
+    """Replace {{PLACEHOLDER}} tags in a paragraph without flattening its runs.
+
+    A tag split across several runs is written into the run where it starts, so that run's formatting is
+    kept; the rest of the tag is removed from the following runs.
+    """
+    runs = paragraph.runs
+    originals = [run.text for run in runs]
+    texts = list(originals)
+    full_text = ''.join(originals)
+    matches = [m for m in PLACEHOLDER_PATTERN.finditer(full_text) if m.group(1) in replacements]
+    if not matches:
+        return False
+    if full_text != paragraph.text:
+        # Part of the text lives outside plain runs (e.g. hyperlinks); fall back to a flat replacement.
+        text = paragraph.text
+        for placeholder, value in replacements.items():
+            text = text.replace(f'{{{{{placeholder}}}}}', str(value))
+        paragraph.text = text
+        return True
+
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text)
+
+    def locate(position):
+        for idx in range(len(starts) - 1, -1, -1):
+            if starts[idx] <= position and (originals[idx] or idx == 0):
+                return idx
+        return 0
+
+    for match in reversed(matches):
+        value = str(replacements[match.group(1)])
+        first = locate(match.start())
+        last = locate(match.end() - 1)
+        head = texts[first][:match.start() - starts[first]]
+        tail = texts[last][match.end() - starts[last]:]
+        if first == last:
+            texts[first] = head + value + tail
+        else:
+            texts[first] = head + value
+            for idx in range(first + 1, last):
+                texts[idx] = ''
+            texts[last] = tail
+
+    for run, original, text in zip(runs, originals, texts):
+        if text != original:
+            run.text = text
+    return True
+
+
+def replace_in_document(document, replacements):
+    """Single pass over the document replacing every tag in replacements."""
+    for paragraph in iter_paragraphs(document):
+        if '{{' in paragraph.text:
+            replace_in_paragraph(paragraph, replacements)
+
+
+class CompiledTemplate:
+    """The bytes of a template plus the positions of the paragraphs that carry placeholders."""
+
+    def __init__(self, path):
+        self.path = path
+        self.mtime = os.path.getmtime(path)
+        with open(path, 'rb') as f:
+            self.blob = f.read()
+        self.locations = []
+        self.placeholders = set()
+        for idx, paragraph in enumerate(iter_paragraphs(self.new_document())):
+            names = set(PLACEHOLDER_PATTERN.findall(paragraph.text))
+            if names:
+                self.locations.append(idx)
+                self.placeholders.update(names)
+
+    def new_document(self):
+        # A fresh parse per letter: deepcopy of a Document detaches python-docx's cached body from the
+        # copied package, so edits made through it are never saved.
+        return Document(io.BytesIO(self.blob))
+
+    def render(self, replacements):
+        """Parse a fresh copy of the template and substitute placeholders only in the indexed paragraphs."""
+        document = self.new_document()
+        if not self.locations:
+            return document
+        wanted = iter(self.locations)
+        target = next(wanted)
+        for idx, paragraph in enumerate(iter_paragraphs(document)):
+            if idx == target:
+                replace_in_paragraph(paragraph, replacements)
+                target = next(wanted, None)
+                if target is None:
+                    break
+        return document
+
+
+class TemplateCache:
+    """Compiles each template once and recompiles it when the file on disk is modified."""
+
+    def __init__(self, templates_dir, logger):
+        self.templates_dir = templates_dir
+        self.logger = logger
+        self.templates = {}
+
+    def get(self, template_name):
+        path = os.path.join(self.templates_dir, f"{template_name}.docx")
+        compiled = self.templates.get(template_name)
+        if compiled is None or os.path.getmtime(path) != compiled.mtime:
+            self.logger.log('info', f"Compiling template: {path}")
+            compiled = CompiledTemplate(path)
+            self.templates[template_name] = compiled
+        return compiled
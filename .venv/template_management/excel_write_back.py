@@ -0,0 +1,87 @@
+from openpyxl import load_workbook
+
+
+def column_index(sheet, header_row):
+    """Map each header name in header_row to its 1-based column index; the first occurrence wins."""
+    header = next(sheet.iter_rows(min_row=header_row, max_row=header_row, values_only=True), ())
+    index = {}
+    for idx, name in enumerate(header, 1):
+        if name is not None:
+            index.setdefault(name, idx)
+    return index
+
+
+def iter_column(sheet, header_row, column):
+    """Yield (row index, value) for one column of every data row below header_row."""
+    rows = sheet.iter_rows(min_row=header_row + 1, min_col=column, max_col=column, values_only=True)
+    for idx, (value,) in enumerate(rows, start=header_row + 1):
+        yield idx, value
+
+
+class ExcelWriteBackSession:
+    """Holds the tracker workbook open for a whole run and batches cell updates into as few saves as possible."""
+
+    DEFAULT_BATCH_SIZE = 100
+
+    def __init__(self, config, logger, batch_size=None):
+        self.config = config
+        self.logger = logger
+        self.file_path = config.LOCAL_EXCEL_FILE
+        self.batch_size = batch_size or getattr(config, 'EXCEL_WRITE_BATCH_SIZE', self.DEFAULT_BATCH_SIZE)
+        self.workbook = None
+        self.sheet = None
+        self.row_index = {}
+        self.column_index = {}
+        self.pending = 0
+
+    def open(self):
+        """Load the workbook once and build the address->row and header->column indexes."""
+        self.logger.log('info', f"Opening Excel write-back session for {self.file_path}")
+        self.workbook = load_workbook(self.file_path)
+        self.sheet = self.workbook[self.config.EXCEL_SHEET_NAME]
+        header_row = self.config.HEADER_ROW
+        self.column_index = column_index(self.sheet, header_row)
+        self.row_index = {}
+        for idx, address in iter_column(self.sheet, header_row, self.column_index[self.config.ADDRESS_COLUMN]):
+            if address is not None:
+                self.row_index.setdefault(address, idx)  # First match wins, as in find_row_index
+        self.logger.log('info', f"Indexed {len(self.row_index)} rows and {len(self.column_index)} columns")
+        return self
+
+    def queue_update(self, address, column_name, value):
+        """Write a cell in memory; the workbook is saved once batch_size updates are pending."""
+        row_idx = self.row_index.get(address)
+        if row_idx is None:
+            raise ValueError(f"No matching row found for address: {address}")
+        col_idx = self.column_index.get(column_name)
+        if col_idx is None:
+            raise KeyError(column_name)
+        self.sheet.cell(row=row_idx, column=col_idx, value=value)
+        self.pending += 1
+        self.logger.log('debug', "Queued %s = '%s' for row %s", column_name, value, row_idx)
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Save the workbook if there are pending updates."""
+        if self.workbook is None or not self.pending:
+            return
+        self.logger.log('info', f"Flushing {self.pending} Excel update(s) to {self.file_path}")
+        self.workbook.save(self.file_path)
+        self.pending = 0
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            if self.workbook is not None:
+                self.workbook.close()
+            self.workbook = None
+            self.sheet = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,130 @@
+import os
+import json
+from datetime import datetime
+from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
+from docx import Document
+import pandas as pd
+from custom_logging.logger import Logger
+from template_management.excel_write_back import ExcelWriteBackSession, column_index, iter_column
+from template_management.compiled_template import TemplateCache
+
+
+class TemplateManager:
+    def __init__(self, config, logger):
+        self.config = config
+        self.logger = logger
+        self.write_back_session = None
+        self.template_cache = TemplateCache(config.TEMPLATES_DIR, logger)
+        self.load_defaults()
+
+    def load_defaults(self):
+        try:
+            self.logger.log('info', 'Loading default configuration')
+            if os.path.exists('default_config.json'):
+                with open('default_config.json', 'r') as f:
+                    self.default_config = json.load(f)
+                    self.logger.log('info', 'Loaded default config with %d keys', len(self.default_config))
+            else:
+                raise FileNotFoundError(
+                    f"default_config.json not found. Please create it with the necessary configurations.")
+        except Exception as e:
+            self.logger.log('error', f"Error loading defaults: {e}")
+            raise
+
+    def load_template(self, template_name):
+        template_path = os.path.join(self.config.TEMPLATES_DIR, f"{template_name}.docx")
+        document = Document(template_path)
+        return document
+
+    def get_compiled_template(self, template_name):
+        """Return the cached compiled template, recompiling it if the .docx has been edited."""
+        return self.template_cache.get(template_name)
+
+    def determine_next_letter(self, data):
+        try:
+            group = self.config.TEMPLATE_GROUP1 if data[self.config.REVIEW_COLUMN] == self.config.REVIEW_POSITIVE_VALUE else self.config.TEMPLATE_GROUP2
+            if pd.isna(data[self.config.LETTER_1_COLUMN]) or data[self.config.LETTER_1_COLUMN] == "":
+                self.logger.log('debug', 'First letter needs to be sent to: %s', data[self.config.NAME_COLUMN])
+                return group['LETTER_1_TEMPLATE']
+            elif pd.isna(data[self.config.LETTER_2_COLUMN]) or data[self.config.LETTER_2_COLUMN] == "":
+                self.logger.log('debug', 'Second letter needs to be sent to: %s', data[self.config.NAME_COLUMN])
+                return group['LETTER_2_TEMPLATE']
+            elif pd.isna(data[self.config.LETTER_3_COLUMN]) or data[self.config.LETTER_3_COLUMN] == "":
+                self.logger.log('debug', 'Third letter needs to be sent to: %s', data[self.config.NAME_COLUMN])
+                return group['LETTER_3_TEMPLATE']
+            else:
+                self.logger.log('debug', 'All letters have been sent to: %s', data[self.config.NAME_COLUMN])
+                return None
+        except KeyError as e:
+            self.logger.log('error', f"Missing key in configuration or data: {e}")
+            raise
+
+    def open_write_back_session(self, batch_size=None):
+        """Start batching update_excel calls into a single in-memory workbook."""
+        self.close_write_back_session()
+        self.write_back_session = ExcelWriteBackSession(self.config, self.logger, batch_size).open()
+        return self.write_back_session
+
+    def close_write_back_session(self):
+        """Flush any queued updates and return to the per-call save path."""
+        session, self.write_back_session = self.write_back_session, None
+        if session is not None:
+            session.close()
+
+    def update_excel(self, data, letter_type):
+        if self.write_back_session is not None:
+            try:
+                col_name = self.get_column_name_for_letter_type(letter_type)
+                if col_name:
+                    with self.logger.span('excel_write'):
+                        self.write_back_session.queue_update(data[self.config.ADDRESS_COLUMN], col_name,
+                                                             f"sent letter {datetime.now().strftime('%d %B %Y')}")
+            except Exception as e:
+                self.logger.log('error', f"Error updating Excel file: {e}")
+                raise
+            return
+
+        try:
+            with self.logger.span('excel_write'):
+                wb = self.get_workbook()
+                sheet = wb[self.config.EXCEL_SHEET_NAME]
+                row_idx = self.find_row_index(sheet, data[self.config.ADDRESS_COLUMN])
+                if row_idx is None:
+                    raise ValueError(f"No matching row found for address: {data[self.config.ADDRESS_COLUMN]}")
+
+                col_name = self.get_column_name_for_letter_type(letter_type)
+                if col_name:
+                    self.update_cell(sheet, row_idx, col_name, f"sent letter {datetime.now().strftime('%d %B %Y')}")
+                    wb.save(self.config.LOCAL_EXCEL_FILE)
+        except Exception as e:
+            self.logger.log('error', f"Error updating Excel file: {e}")
+            raise
+
+    def get_workbook(self):
+        return load_workbook(self.config.LOCAL_EXCEL_FILE)
+
+    def find_row_index(self, sheet, address):
+        address_col = self.get_column_index(sheet, self.config.ADDRESS_COLUMN)
+        for idx, value in iter_column(sheet, self.config.HEADER_ROW, address_col):
+            if value == address:
+                return idx
+        return None
+
+    def get_column_index(self, sheet, column_name):
+        return column_index(sheet, self.config.HEADER_ROW)[column_name]
+
+    def get_column_name_for_letter_type(self, letter_type):
+        for key, value in self.config.TEMPLATE_GROUP1.items():
+            if value == letter_type:
+                return getattr(self.config, key.replace('TEMPLATE', 'COLUMN'))
+        for key, value in self.config.TEMPLATE_GROUP2.items():
+            if value == letter_type:
+                return getattr(self.config, key.replace('TEMPLATE', 'COLUMN'))
+        return None
+
+    def update_cell(self, sheet, row_index, column_name, value):
+        column_letter = get_column_letter(self.get_column_index(sheet, column_name))
+        cell = f"{column_letter}{row_index}"
+        sheet[cell] = value
+        self.logger.log('info', "Updated %s with '%s' for row %s", column_name, value, row_index)
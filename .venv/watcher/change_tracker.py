@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+import pandas as pd
+
+
+class ChangeTracker:
+    """Remembers what the watcher has already seen: the source's version tag and a hash per tracker row.
+
+    State is kept in a JSON file so a restarted watcher does not reprocess rows it handled before.
+    """
+
+    def __init__(self, state_path, logger):
+        self.state_path = state_path
+        self.logger = logger
+        self.state = {'remote_tag': None, 'local_signature': None, 'row_hashes': {}}
+        self.pending_hashes = None
+        self.pending_keys = []
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r') as f:
+                self.state.update(json.load(f))
+        except (OSError, ValueError) as e:
+            self.logger.log('warning', f"Could not read watcher state {self.state_path}, starting fresh: {e}")
+
+    def save(self):
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def remote_changed(self, tag):
+        """True if the drive item's cTag/eTag differs from the last one processed."""
+        return tag is None or tag != self.state['remote_tag']
+
+    def local_changed(self, file_path):
+        """Compare mtime and size first; only hash the file when they differ from the stored signature."""
+        stat = os.stat(file_path)
+        signature = self.state['local_signature'] or {}
+        if signature.get('mtime') == stat.st_mtime and signature.get('size') == stat.st_size:
+            return False, signature
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        new_signature = {'mtime': stat.st_mtime, 'size': stat.st_size, 'sha256': digest.hexdigest()}
+        if signature.get('sha256') == new_signature['sha256']:
+            # Touched but not edited; remember the new mtime so the file is not hashed again next tick.
+            self.state['local_signature'] = new_signature
+            self.save()
+            return False, new_signature
+        return True, new_signature
+
+    def changed_rows(self, df, key_column, fallback_column=None):
+        """Return the rows of df that are new or whose contents changed since the last commit.
+
+        Repeated keys (duplicate work orders, blank work orders sharing an address) get an occurrence suffix,
+        so each row keeps its own hash.
+        """
+        hashes = {}
+        occurrences = {}
+        changed = []
+        changed_keys = []
+        previous = self.state['row_hashes']
+        key_idx = df.columns.get_loc(key_column)
+        fallback_idx = df.columns.get_loc(fallback_column) if fallback_column in df.columns else None
+        for position, row in enumerate(df.itertuples(index=False, name=None)):
+            key = row[key_idx]
+            if pd.isna(key) or key == '':
+                key = f"address:{row[fallback_idx]}" if fallback_idx is not None else f"row:{position}"
+            key = str(key)
+            occurrences[key] = occurrences.get(key, 0) + 1
+            if occurrences[key] > 1:
+                key = f"{key}#{occurrences[key]}"
+            row_hash = hashlib.sha1('\x1f'.join('' if pd.isna(v) else str(v) for v in row).encode('utf-8')).hexdigest()
+            hashes[key] = row_hash
+            if previous.get(key) != row_hash:
+                changed.append(position)
+                changed_keys.append(key)
+        self.pending_hashes = hashes
+        self.pending_keys = changed_keys
+        return df.iloc[changed]
+
+    def commit(self, remote_tag=None, local_signature=None, failed=()):
+        """Persist the hashes from the last changed_rows() call together with the source version.
+
+        failed holds positions within the frame changed_rows() returned; those rows keep their previous hash
+        so the next tick retries them.
+        """
+        if self.pending_hashes is not None:
+            previous = self.state['row_hashes']
+            for position in failed:
+                key = self.pending_keys[position]
+                if key in previous:
+                    self.pending_hashes[key] = previous[key]
+                else:
+                    self.pending_hashes.pop(key, None)
+            self.state['row_hashes'] = self.pending_hashes
+            self.pending_hashes = None
+            self.pending_keys = []
+        if remote_tag is not None:
+            self.state['remote_tag'] = remote_tag
+        if local_signature is not None:
+            self.state['local_signature'] = local_signature
+        self.save()
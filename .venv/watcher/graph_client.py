@@ -0,0 +1,180 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import range_boundaries
+
+GRAPH_SCOPES = ["https://graph.microsoft.com/.default"]
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class TokenCache:
+    """Client-credentials token that is refreshed shortly before it expires."""
+
+    def __init__(self, app, logger, scopes=None, refresh_margin=300, max_retries=3):
+        self.app = app
+        self.logger = logger
+        self.scopes = scopes or GRAPH_SCOPES
+        self.refresh_margin = refresh_margin
+        self.max_retries = max_retries
+        self.token = None
+        self.expires_at = 0.0
+        self.lock = threading.Lock()
+
+    def get(self):
+        with self.lock:
+            if self.token is None or time.monotonic() >= self.expires_at - self.refresh_margin:
+                self._acquire()
+            return self.token
+
+    def invalidate(self, rejected_token):
+        """Replace a token Graph rejected; concurrent callers holding the same token share one refresh."""
+        with self.lock:
+            if self.token == rejected_token:
+                self._evict_cached_tokens()
+                self._acquire()
+            return self.token
+
+    def _evict_cached_tokens(self):
+        # acquire_token_for_client returns MSAL's cached access token until it is close to expiry, so a
+        # rejected token has to be removed from the app's cache before a new one can be requested.
+        cache = getattr(self.app, 'token_cache', None)
+        if cache is None:
+            return
+        for entry in list(cache.search(cache.CredentialType.ACCESS_TOKEN)):
+            cache.remove_at(entry)
+
+    def _acquire(self):
+        for attempt in range(self.max_retries):
+            result = self.app.acquire_token_for_client(scopes=self.scopes)
+            if "access_token" in result:
+                self.token = result['access_token']
+                self.expires_at = time.monotonic() + int(result.get('expires_in', 3600))
+                self.logger.log('info', 'Successfully acquired token')
+                return
+            self.logger.log('warning', f"Failed to acquire token ({result.get('error')}), retrying...")
+            time.sleep(backoff_delay(attempt))
+        self.logger.log('error', 'Could not acquire token after retries')
+        raise Exception("Could not acquire token after retries.")
+
+
+class GraphWorkbookClient:
+    """Pooled, retrying access to one workbook stored in a drive, with chunked range reads."""
+
+    def __init__(self, base_url, drive_id, item_id, token_cache, logger, max_retries=5, chunk_rows=5000,
+                 max_workers=4, timeout=60):
+        self.base_url = base_url.rstrip('/')
+        self.drive_id = drive_id
+        self.item_id = item_id
+        self.token_cache = token_cache
+        self.logger = logger
+        self.max_retries = max_retries
+        self.chunk_rows = chunk_rows
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @property
+    def item_url(self):
+        return f"{self.base_url}/drives/{self.drive_id}/items/{self.item_id}"
+
+    def get(self, url, params=None):
+        """GET with token refresh on 401 and jittered backoff on throttling, honouring Retry-After."""
+        refreshed = False
+        for attempt in range(self.max_retries + 1):
+            token = self.token_cache.get()
+            headers = {"Authorization": f"Bearer {token}"}
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = backoff_delay(attempt)
+                self.logger.log('warning', f"Graph request failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            if response.status_code == 401 and not refreshed:
+                self.token_cache.invalidate(token)
+                refreshed = True
+                continue
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                retry_after = response.headers.get('Retry-After')
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else backoff_delay(attempt)
+                self.logger.log('warning', f"Graph returned {response.status_code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            response.raise_for_status()
+            return response.json()
+        raise RuntimeError(f"Graph request to {url} failed after {self.max_retries} retries")
+
+    def get_item_tag(self):
+        item = self.get(self.item_url, params={'$select': 'id,eTag,cTag'})
+        return item.get('cTag') or item.get('eTag')
+
+    def get_worksheet_id(self, sheet_name):
+        worksheets = self.get(f"{self.item_url}/workbook/worksheets").get('value', [])
+        for worksheet in worksheets:
+            if worksheet['name'] == sheet_name:
+                return worksheet['id']
+        raise KeyError(f"Worksheet {sheet_name} does not exist.")
+
+    def worksheet_url(self, worksheet_id):
+        return f"{self.item_url}/workbook/worksheets/{worksheet_id}"
+
+    def get_used_range(self, worksheet_id, values=True):
+        if values:
+            return self.get(f"{self.worksheet_url(worksheet_id)}/usedRange")
+        # valuesOnly is a function argument in Graph, not a query parameter
+        return self.get(f"{self.worksheet_url(worksheet_id)}/usedRange(valuesOnly=true)",
+                        params={'$select': 'address'})
+
+    def get_range_values(self, worksheet_id, address):
+        response = self.get(f"{self.worksheet_url(worksheet_id)}/range(address='{address}')",
+                            params={'$select': 'values'})
+        return response.get('values') or []
+
+    def fetch_sheet_columns(self, sheet_name, header_row):
+        """Read the used range in row blocks, in parallel, straight into per-column lists.
+
+        Returns (header, columns); empty cells are None. Only one block's JSON is held per worker at a time.
+        """
+        worksheet_id = self.get_worksheet_id(sheet_name)
+        address = self.get_used_range(worksheet_id, values=False)['address'].split('!')[-1]
+        min_col, min_row, max_col, max_row = range_boundaries(address)
+        first_col, last_col = get_column_letter(min_col), get_column_letter(max_col)
+        if header_row < min_row or header_row > max_row:
+            raise ValueError(f"Header row {header_row} is outside the used range {address}")
+
+        header = self.get_range_values(worksheet_id, f"{first_col}{header_row}:{last_col}{header_row}")[0]
+        total = max_row - header_row
+        width = max_col - min_col + 1
+        columns = [[None] * total for _ in range(width)]
+        blocks = [(start, min(start + self.chunk_rows - 1, max_row))
+                  for start in range(header_row + 1, max_row + 1, self.chunk_rows)]
+        self.logger.log('info', f"Fetching {total} rows of {sheet_name} in {len(blocks)} block(s)")
+
+        def fetch(block):
+            start, end = block
+            values = self.get_range_values(worksheet_id, f"{first_col}{start}:{last_col}{end}")
+            offset = start - header_row - 1
+            for col_idx, column in enumerate(columns):
+                column[offset:offset + len(values)] = [None if row[col_idx] == '' else row[col_idx]
+                                                       for row in values]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(fetch, blocks))
+        return header, columns
+
+    def close(self):
+        self.session.close()
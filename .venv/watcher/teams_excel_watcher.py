@@ -0,0 +1,116 @@
+import time
+from msal import ConfidentialClientApplication
+import config.settings as settings
+from data_collection.data_collector import DataCollector
+from custom_logging.logger import Logger
+from watcher.change_tracker import ChangeTracker
+from watcher.graph_client import GraphWorkbookClient, TokenCache
+
+GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
+
+
+class TeamsExcelWatcher:
+    def __init__(self, data_collector, logger, tenant_id, client_id, client_secret, excel_file_id, excel_file_drive,
+                 config=None, letter_generator=None, app=None):
+        self.data_collector = data_collector
+        self.logger = logger
+        self.config = config or settings.load_defaults()
+        self.letter_generator = letter_generator
+        self.excel_file_id = excel_file_id
+        self.excel_file_drive = excel_file_drive
+        self.graph_base_url = getattr(self.config, 'GRAPH_BASE_URL', GRAPH_BASE_URL).rstrip('/')
+        self.tracker = ChangeTracker(getattr(self.config, 'WATCHER_STATE_FILE', 'watcher_state.json'), logger)
+
+        self.app = app
+        self.token_cache = None
+        self.client = None
+        if self.config.USE_TEAMS_EXCEL:  # Watching a local file needs no Graph credentials
+            self.app = app or ConfidentialClientApplication(
+                client_id,
+                authority=f"https://login.microsoftonline.com/{tenant_id}",
+                client_credential=client_secret
+            )
+            self.token_cache = TokenCache(self.app, logger)
+            self.client = GraphWorkbookClient(self.graph_base_url, excel_file_drive, excel_file_id, self.token_cache,
+                                              logger, chunk_rows=getattr(self.config, 'GRAPH_CHUNK_ROWS', 5000),
+                                              max_workers=getattr(self.config, 'GRAPH_MAX_WORKERS', 4))
+            self.acquire_token()  # Fail fast on bad credentials
+
+    def acquire_token(self):
+        return self.token_cache.get()
+
+    def get_item_tag(self):
+        """Return the drive item's cTag (content tag), falling back to its eTag; None if unavailable."""
+        try:
+            return self.client.get_item_tag()
+        except Exception as e:
+            self.logger.log('warning', f'Exception during drive item metadata fetch: {str(e)}')
+        return None
+
+    def get_excel_data(self):
+        """Return the raw usedRange response of the configured sheet, or None on failure."""
+        self.logger.log('info', 'Getting Excel data from Teams')
+        try:
+            worksheet_id = self.client.get_worksheet_id(self.config.EXCEL_SHEET_NAME)
+            return self.client.get_used_range(worksheet_id)
+        except Exception as e:
+            self.logger.log('error', f'Exception during Excel data fetch: {str(e)}')
+        return None
+
+    def get_excel_dataframe(self):
+        """Fetch the configured sheet in row blocks and return it as a DataFrame, or None on failure."""
+        self.logger.log('info', 'Getting Excel data from Teams')
+        try:
+            with self.logger.span('data_load'):
+                header, columns = self.client.fetch_sheet_columns(self.config.EXCEL_SHEET_NAME, self.config.HEADER_ROW)
+            return self.data_collector.frame_from_columns(header, columns)
+        except Exception as e:
+            self.logger.log('error', f'Exception during Excel data fetch: {str(e)}')
+        return None
+
+    def check_for_changes(self):
+        """Run one watcher tick and return counts of rows examined, sent to the generator and failed."""
+        stats = {'examined': 0, 'processed': 0, 'failed': 0}
+        self.logger.start_run()  # Metrics cover this tick only, not the sleep before it
+        remote_tag = local_signature = None
+        if self.config.USE_TEAMS_EXCEL:
+            remote_tag = self.get_item_tag()
+            if not self.tracker.remote_changed(remote_tag):
+                self.logger.log('info', 'Teams Excel sheet unchanged since last check')
+                return stats
+            df = self.get_excel_dataframe()
+            if df is None:
+                return stats
+        else:
+            changed, local_signature = self.tracker.local_changed(self.config.LOCAL_EXCEL_FILE)
+            if not changed:
+                self.logger.log('info', 'Local Excel file unchanged since last check')
+                return stats
+            df = self.data_collector.collect_data()
+
+        stats['examined'] = len(df)
+        changed_rows = self.tracker.changed_rows(df, self.config.WORK_ORDER_COLUMN, self.config.ADDRESS_COLUMN)
+        stats['processed'] = len(changed_rows)
+        failed = []
+        if len(changed_rows) and self.letter_generator is not None:
+            failed = self.letter_generator.generate_and_print_letters(changed_rows.to_dict(orient='records'))
+        if failed:
+            # Leave the source version uncommitted so the next tick re-reads it and retries the failed rows.
+            self.tracker.commit(failed=failed)
+            self.logger.log('warning', f"{len(failed)} row(s) failed and will be retried on the next check")
+        else:
+            self.tracker.commit(remote_tag=remote_tag, local_signature=local_signature)
+        stats['failed'] = len(failed)
+        self.logger.log('info', f"Watcher tick: examined {stats['examined']} rows, processed {stats['processed']}")
+        return stats
+
+    def watch_for_changes(self):
+        while True:
+            source = 'Teams-stored Excel sheet' if self.config.USE_TEAMS_EXCEL else 'local Excel file'
+            self.logger.log('info', f'Watching for changes in {source}')
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                self.logger.log('error', f'Error while checking for changes: {e}')
+
+            time.sleep(self.config.WATCHER_INTERVAL)  # Configurable interval